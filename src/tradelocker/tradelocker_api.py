@@ -1,13 +1,14 @@
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 import datetime
-import json
 from functools import lru_cache
-from typing import Callable, cast, Literal, Optional, DefaultDict, Any
+from typing import Callable, cast, Iterator, Literal, Optional, DefaultDict, Any
 import logging
 import requests
 
 import jwt
 
+import numpy as np
 import pandas as pd
 
 from requests.exceptions import HTTPError
@@ -24,6 +25,7 @@ from tradelocker.utils import (
     time_to_token_expiry,
     disk_or_memory_cache,
     always_return_true,
+    tl_json_loads,
 )
 
 from .__about__ import __version__
@@ -63,6 +65,7 @@ from .types import (
     PositionsColumns,
     PriceHistoryColumns,
     InstrumentsColumns,
+    AccountState,
     int64,
 )
 from .exceptions import TLAPIException, TLAPIOrderException
@@ -147,16 +150,33 @@ class TLAPI:
 
         """Initializes the TradeLocker API client."""
         self._base_url: str = f"{environment}/backend-api"
+        # Endpoint URLs that never change for the life of the client, built once
+        self._quotes_url: str = f"{self._base_url}/trade/quotes"
+        self._config_url: str = f"{self._base_url}/trade/config"
+        self._daily_bar_url: str = f"{self._base_url}/trade/dailyBar"
+        self._depth_url: str = f"{self._base_url}/trade/depth"
+        self._history_url: str = f"{self._base_url}/trade/history"
         self._credentials: Optional[CredentialsType] = None
+        # A shared session keeps connections alive across requests (incl. deletes),
+        # avoiding a fresh TCP+TLS handshake per call
+        self._session: requests.Session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=16, pool_maxsize=64)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
 
         self._access_token: str = ""
         self._refresh_token: str = ""
+        # Assembled header dicts, cached until the token rotates or the account changes
+        self._cached_headers_with_accnum: Optional[RequestsMappingType] = None
+        self._cached_headers_no_accnum: Optional[RequestsMappingType] = None
         self.acc_num: int = 0
         self.account_id: int = 0
         self.environment: str = environment
 
         self.developer_api_key = developer_api_key
         self.release = release or str(__version__)
+        # The referral values attached to every request; built once, shared by _get_params
+        self._base_params: RequestsMappingType = {"ref": "py_c", "v": self.release}
 
         if username and password and server:
             self._credentials = {
@@ -256,28 +276,33 @@ class TLAPI:
 
         # Pick the correct account, either by having account_id, or acc_num specified
         if account_id != 0:
-            if account_id not in all_accounts["id"].values:
+            # Filter once and reuse the row, instead of re-applying the boolean mask per column
+            matching_accounts = all_accounts[all_accounts["id"] == account_id]
+            if matching_accounts.empty:
                 raise ValueError(
                     f"account_id '{account_id}' not found in all_accounts:\n{all_accounts} "
                 )
 
+            account_row = matching_accounts.iloc[0]
             self.account_id = account_id
             # Find the acc_num for the specified account_id
-            self.acc_num = int(all_accounts[all_accounts["id"] == account_id]["accNum"].iloc[0])
-            self.account_name = all_accounts[all_accounts["id"] == account_id]["name"].iloc[0]
+            self.acc_num = int(account_row["accNum"])
+            self.account_name = account_row["name"]
 
             self.log.debug(
                 f"Logging in using the specified account_id: {account_id}, using acc_num: {self.acc_num}"
             )
 
         elif acc_num != 0:
-            if acc_num not in all_accounts["accNum"].values:
+            matching_accounts = all_accounts[all_accounts["accNum"] == acc_num]
+            if matching_accounts.empty:
                 raise ValueError(f"acc_num '{acc_num}' not found in all_accounts:\n{all_accounts}")
 
+            account_row = matching_accounts.iloc[0]
             self.acc_num = acc_num
             # Find the account_id for the specified acc_num
-            self.account_id = int(all_accounts[all_accounts["accNum"] == acc_num]["id"].iloc[0])
-            self.account_name = all_accounts[all_accounts["accNum"] == acc_num]["name"].iloc[0]
+            self.account_id = int(account_row["id"])
+            self.account_name = account_row["name"]
 
             self.log.debug(
                 f"Logging in using the specified acc_num: {acc_num}, using account_id: {self.account_id}"
@@ -285,14 +310,21 @@ class TLAPI:
         else:
             self.log.debug("Neither account_id nor acc_num specified, using the first account")
             # use the last account in the list
-            self.account_id = int(all_accounts["id"].iloc[0])
-            self.acc_num = int(all_accounts["accNum"].iloc[0])
-            self.account_name = all_accounts["name"].iloc[0]
+            account_row = all_accounts.iloc[0]
+            self.account_id = int(account_row["id"])
+            self.acc_num = int(account_row["accNum"])
+            self.account_name = account_row["name"]
 
             self.log.debug(
                 f"Logging in using the first account, account_id: {self.account_id}, acc_num: {self.acc_num}"
             )
 
+        # The accNum header is baked into the cached headers, so they are stale now
+        self._invalidate_cached_headers()
+
+        # URL prefix for the account-scoped endpoints, rebuilt when the account changes
+        self._account_url = f"{self._base_url}/trade/accounts/{self.account_id}"
+
     def _auth_with_tokens(self, access_token: str, refresh_token: str) -> None:
         """Stores the access and refresh tokens."""
         self._access_token = access_token
@@ -302,13 +334,13 @@ class TLAPI:
 
     @lru_cache
     @tl_typechecked
-    def _get_column_names(self, object_name: ColumnConfigKeysType) -> list[str]:
+    def _get_column_names(self, object_name: ColumnConfigKeysType) -> tuple[str, ...]:
         """Returns the column names of values in orders/positions, etc. from the /config endpoint
 
         Args:
             object_name (ColumnConfigKeysType): The name of the object to get the column names for
         Returns:
-            list[str]: The column names
+            tuple[str, ...]: The column names
         """
         config_dict: ConfigType = self.get_config()
 
@@ -323,7 +355,8 @@ class TLAPI:
 
         tl_check_type(config_columns, ConfigColumnType)
 
-        object_columns: list[str] = [column["id"] for column in config_columns]
+        # A tuple keeps the lru_cached value immutable for all callers
+        object_columns: tuple[str, ...] = tuple(column["id"] for column in config_columns)
         return object_columns
 
     @lru_cache
@@ -336,7 +369,7 @@ class TLAPI:
     @log_func
     def _info_route_valid(self, route_id: str, instrument_id: int) -> bool:
         """Checks if the INFO route is valid for the specified instrument_id by making a simple /trade/quotes request"""
-        route_url = f"{self.get_base_url()}/trade/quotes"
+        route_url = self._quotes_url
 
         additional_params: DictValuesType = {
             "tradableInstrumentId": instrument_id,
@@ -394,25 +427,30 @@ class TLAPI:
     def get_price_history_rate_limit(self) -> RateLimitType:
         return self.get_route_rate_limit("QUOTES_HISTORY")
 
+    @lru_cache
+    def _get_routes_by_instrument(self) -> dict[int, list[RouteType]]:
+        """Builds the instrument_id -> routes index from the instruments table, once."""
+        all_instruments: pd.DataFrame = self.get_all_instruments()
+        # .tolist() yields plain Python ints for the dict keys
+        return dict(
+            zip(all_instruments["tradableInstrumentId"].tolist(), all_instruments["routes"])
+        )
+
     @lru_cache
     @log_func
     @tl_typechecked
     def _get_route_ids(self, instrument_id: int, route_type: RouteTypeType) -> list[str]:
         """Returns the route_id for the specified instrument_id and route_type (TRADE/INFO)"""
-        all_instruments: pd.DataFrame = self.get_all_instruments()
-        matching_instruments: pd.DataFrame = all_instruments[
-            all_instruments["tradableInstrumentId"] == instrument_id
-        ]
-        try:
-            routes: list[RouteType] = matching_instruments["routes"].iloc[0]
-            # filter routes by type
-            matching_routes: list[str] = [
-                str(route["id"]) for route in routes if route["type"] == route_type
-            ]
-            return matching_routes
-        except IndexError:
+        routes: Optional[list[RouteType]] = self._get_routes_by_instrument().get(instrument_id)
+        if routes is None:
             raise TLAPIException(f"No {route_type} route found for {instrument_id=}")
 
+        # filter routes by type
+        matching_routes: list[str] = [
+            str(route["id"]) for route in routes if route["type"] == route_type
+        ]
+        return matching_routes
+
     @tl_typechecked
     def _get_headers(
         self,
@@ -429,10 +467,24 @@ class TLAPI:
         Returns:
             The final headers
         """
+        cacheable = include_access_token and additional_headers is None
+
+        if include_access_token:
+            # get_access_token() refreshes the token when needed, which invalidates the cache
+            access_token = self.get_access_token()
+            if cacheable:
+                cached_headers = (
+                    self._cached_headers_with_accnum
+                    if include_acc_num
+                    else self._cached_headers_no_accnum
+                )
+                if cached_headers is not None:
+                    return cached_headers
+
         headers: RequestsMappingType = {}
 
         if include_access_token:
-            headers["Authorization"] = f"Bearer {self.get_access_token()}"
+            headers["Authorization"] = f"Bearer {access_token}"
 
         if include_acc_num:
             headers["accNum"] = str(self.acc_num)
@@ -443,9 +495,19 @@ class TLAPI:
 
         if additional_headers is not None:
             headers.update(cast(RequestsMappingType, additional_headers))
+        elif cacheable:
+            if include_acc_num:
+                self._cached_headers_with_accnum = headers
+            else:
+                self._cached_headers_no_accnum = headers
 
         return headers
 
+    def _invalidate_cached_headers(self) -> None:
+        """Drops the cached header dicts after a token rotation or account change."""
+        self._cached_headers_with_accnum = None
+        self._cached_headers_no_accnum = None
+
     @tl_typechecked
     def _get_params(
         self, additional_params: Optional[DictValuesType] = None
@@ -458,10 +520,13 @@ class TLAPI:
         Returns:
             The final parameters
         """
-        final_params: RequestsMappingType = {"ref": "py_c", "v": self.release}
-        if additional_params is not None:
-            for key, value in cast(RequestsMappingType, additional_params).items():
-                final_params[key] = str(value)
+        if not additional_params:
+            # Shared dict for the common zero-extra-params case -- callers must not mutate it
+            return self._base_params
+
+        final_params: RequestsMappingType = dict(self._base_params)
+        for key, value in cast(RequestsMappingType, additional_params).items():
+            final_params[key] = value if isinstance(value, str) else str(value)
 
         return final_params
 
@@ -495,13 +560,15 @@ class TLAPI:
         """
         self._raise_from_response_status(response)
 
-        if response.text == "":
+        # Check the raw bytes to avoid decoding the whole body just to test emptiness
+        if not response.content:
             raise ValueError(f"Empty response received from the API for {response.url}")
 
         try:
-            response_json: JSONType = response.json()
+            # Parse the raw bytes directly (orjson when available), skipping response.json()
+            response_json: JSONType = tl_json_loads(response.content)
             return response_json
-        except json.decoder.JSONDecodeError as err:
+        except ValueError as err:
             error_msg = f"Failed to decode JSON response from {response.url}. Received response:\n'{response.text}'\n{err}"
             raise ValueError(error_msg) from err
 
@@ -542,7 +609,7 @@ class TLAPI:
             include_access_token=include_access_token,
         )
         params = self._get_params(additional_params)
-        request_method = getattr(requests, request_type)
+        request_method = getattr(self._session, request_type)
         kwargs = {
             "url": url,
             "headers": headers,
@@ -581,16 +648,32 @@ class TLAPI:
         for column in df.columns:
             if column not in column_types:
                 self.log.error(f"Missing type specification for column {column} in {column_types}")
-            else:
-                try:
-                    # Only convert the ints and floats after replacing "None" values with 0
-                    if column_types[column] in [int64, float]:
-                        df[column] = df[column].fillna(0).astype(column_types[column])
-
-                except TLAPIException as err:
-                    self.log.warning(
-                        f"Failed to apply type {column_types[column]} to column {column}: {err}"
-                    )
+
+        # Only convert the ints and floats after replacing "None" values with 0.
+        # A single astype(dict) call converts all of them in one pass instead of
+        # reallocating the frame column-by-column.
+        numeric_types = {
+            column: column_type
+            for column, column_type in column_types.items()
+            if column in df.columns and column_type in (int64, float)
+        }
+        if numeric_types:
+            numeric_columns = list(numeric_types)
+            try:
+                df[numeric_columns] = df[numeric_columns].fillna(0).astype(numeric_types)
+            except TLAPIException as err:
+                self.log.warning(f"Failed to apply types {numeric_types}: {err}")
+
+        # Closed Literal-valued columns (side/type/validity) become categoricals,
+        # which are much cheaper to store and filter than object-dtype strings
+        categorical_types = {
+            column: column_type
+            for column, column_type in column_types.items()
+            if column in df.columns and isinstance(column_type, pd.CategoricalDtype)
+        }
+        if categorical_types:
+            categorical_columns = list(categorical_types)
+            df[categorical_columns] = df[categorical_columns].astype(categorical_types)
 
     ############################## PUBLIC UTILS #######################
 
@@ -600,6 +683,9 @@ class TLAPI:
     def get_instrument_id_from_symbol_name(self, symbol_name: str) -> int:
         """Returns the instrument Id from the given symol's name.
 
+        The mapping is static for a session; lru_cache memoizes resolutions so
+        repeat calls skip the catalog scan, and failed lookups are never cached.
+
         Args:
             symbol_name (str): Name of the symbol, for example `BTCUSD`
 
@@ -681,7 +767,7 @@ class TLAPI:
         Returns:
             bool: True if executed successfully False otherwise
         """
-        route_url = f"{self.get_base_url()}/trade/accounts/{self.account_id}/positions"
+        route_url = f"{self._account_url}/positions"
 
         additional_params: DictValuesType = {}
         if instrument_id_filter != 0:
@@ -729,7 +815,7 @@ class TLAPI:
         Returns:
             bool: True if executed successfully False otherwise
         """
-        route_url = f"{self.get_base_url()}/trade/accounts/{self.account_id}/orders"
+        route_url = f"{self._account_url}/orders"
 
         additional_params: DictValuesType = {}
         if instrument_id_filter != 0:
@@ -834,8 +920,10 @@ class TLAPI:
         # prepare closing details
         position_id: int = list(position_sizes.keys())[0]
         # since the size is calculated using floats make sure that no float artefacts are submitted
-        # by rounding the size to a specific precision which cuts of the artefacts
-        quantity_to_close: float = round(position_sizes[position_id], self._SIZE_PRECISION)
+        # by rounding the size to a specific precision which cuts of the artefacts;
+        # scaled-integer rounding is cheaper than round(x, ndigits)
+        size_scale: int = 10**self._SIZE_PRECISION
+        quantity_to_close: float = round(position_sizes[position_id] * size_scale) / size_scale
         if close_quantity:
             quantity_to_close = min(quantity_to_close, close_quantity)
         if quantity_to_close < self._MIN_LOT_SIZE:
@@ -871,6 +959,7 @@ class TLAPI:
             self._access_token = get_nested_key(response_json, ["accessToken"], str)
             self._refresh_token = get_nested_key(response_json, ["refreshToken"], str)
             assert self._access_token and self._refresh_token
+            self._invalidate_cached_headers()
             self.log.info("Successfully fetched authentication tokens")
         except Exception as err:
             self.log.critical(f"Failed to fetch authentication tokens: {err}")
@@ -892,6 +981,7 @@ class TLAPI:
 
         self._access_token = get_nested_key(response_json, ["accessToken"], str)
         self._refresh_token = get_nested_key(response_json, ["refreshToken"], str)
+        self._invalidate_cached_headers()
 
     @disk_or_memory_cache(cache_validation_callback=expires_after(days=1))
     @log_func
@@ -933,7 +1023,7 @@ class TLAPI:
         Returns:
             ConfigType: The configuration
         """
-        route_url = f"{self.get_base_url()}/trade/config"
+        route_url = self._config_url
         response_json = self._request("get", route_url)
         config_dict: ConfigType = get_nested_key(response_json, ["d"], ConfigType)
         return config_dict
@@ -969,7 +1059,7 @@ class TLAPI:
         Returns:
             pd.DataFrame[ExecutionsColumnTypes]: DataFrame containing all executed orders
         """
-        route_url = f"{self.get_base_url()}/trade/accounts/{self.account_id}/executions"
+        route_url = f"{self._account_url}/executions"
 
         response_json = self._request("get", route_url)
 
@@ -982,6 +1072,31 @@ class TLAPI:
 
         return all_executions
 
+    @tl_typechecked
+    def iter_executions(self, limit: Optional[int] = None) -> Iterator[dict[str, Any]]:
+        """Yields executions as plain dicts, without building a typed DataFrame.
+
+        Cheaper than get_all_executions for callers polling only the latest fills.
+
+        Route Name: GET_EXECUTIONS
+
+        Args:
+            limit (int, optional): If set, only the latest `limit` executions are yielded.
+
+        Yields:
+            dict[str, Any]: One execution per row, keyed by the filledOrdersConfig columns
+        """
+        route_url = f"{self._account_url}/executions"
+
+        response_json = self._request("get", route_url)
+        raw_executions = get_nested_key(response_json, ["d", "executions"])
+        column_names = self._get_column_names("filledOrdersConfig")
+
+        if limit:
+            raw_executions = raw_executions[-limit:]
+        for row in raw_executions:
+            yield dict(zip(column_names, row))
+
     @disk_or_memory_cache(cache_validation_callback=expires_after(days=1))
     @log_func
     @tl_typechecked
@@ -993,7 +1108,7 @@ class TLAPI:
         Returns:
             pd.DataFrame[InstrumentsColumnsTypes]: DataFrame with all available instruments
         """
-        route_url = f"{self.get_base_url()}/trade/accounts/{self.account_id}/instruments"
+        route_url = f"{self._account_url}/instruments"
 
         response_json = self._request("get", route_url)
 
@@ -1037,7 +1152,7 @@ class TLAPI:
             pd.DataFrame[OrdersColumnsTypes]: DataFrame containing all orders
         """
         endpoint = "orders" + ("History" if history else "")
-        route_url = f"{self.get_base_url()}/trade/accounts/{self.account_id}/{endpoint}"
+        route_url = f"{self._account_url}/{endpoint}"
 
         if lookback_period != "":
             start_timestamp, end_timestamp = resolve_lookback_and_timestamps(
@@ -1058,6 +1173,10 @@ class TLAPI:
         all_orders_raw = get_nested_key(response_json, ["d", endpoint])
 
         column_names = self._get_column_names(endpoint + "Config")
+        if not all_orders_raw:
+            # Skip the row ingestion and typing pass entirely for empty returns
+            return pd.DataFrame(columns=column_names)
+
         all_orders = pd.DataFrame(all_orders_raw, columns=column_names)
         self._apply_typing(all_orders, OrdersColumns)
 
@@ -1073,7 +1192,7 @@ class TLAPI:
         Returns:
             pd.DataFrame[PositionsColumnsTypes]: DataFrame containing all positions
         """
-        route_url = f"{self.get_base_url()}/trade/accounts/{self.account_id}/positions"
+        route_url = f"{self._account_url}/positions"
 
         response_json = self._request("get", route_url)
         all_positions_raw = get_nested_key(response_json, ["d", "positions"])
@@ -1084,6 +1203,49 @@ class TLAPI:
 
         return all_positions
 
+    @log_func
+    @tl_typechecked
+    def get_account_snapshot(self) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+        """Fetches all orders, positions and executions concurrently.
+
+        The three endpoint calls are independent, so issuing them in parallel
+        costs roughly one round trip instead of three.
+
+        Returns:
+            tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]: (orders, positions, executions)
+        """
+        # Refresh the access token up front so the worker threads don't race to do it
+        self.get_access_token()
+
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            orders_future = executor.submit(self.get_all_orders)
+            positions_future = executor.submit(self.get_all_positions)
+            executions_future = executor.submit(self.get_all_executions)
+            return (
+                orders_future.result(),
+                positions_future.result(),
+                executions_future.result(),
+            )
+
+    @log_func
+    @tl_typechecked
+    def _get_positions_raw(self, instrument_id_filter: int = 0) -> list[Any]:
+        """Returns the raw positions rows, optionally filtered server-side by instrument.
+
+        Used by hot paths that do not need the DataFrame construction and typing
+        performed by get_all_positions. Row values are positional, ordered as in
+        _get_column_names("positionsConfig").
+        """
+        route_url = f"{self._account_url}/positions"
+
+        additional_params: DictValuesType = {}
+        if instrument_id_filter != 0:
+            additional_params["tradableInstrumentId"] = str(instrument_id_filter)
+
+        response_json = self._request("get", route_url, additional_params=additional_params)
+        positions_raw: list[Any] = get_nested_key(response_json, ["d", "positions"])
+        return positions_raw
+
     @log_func
     @tl_typechecked
     def get_account_state(self) -> DictValuesType:
@@ -1094,7 +1256,7 @@ class TLAPI:
         Returns:
             DictValuesType: The account state
         """
-        route_url = f"{self.get_base_url()}/trade/accounts/{self.account_id}/state"
+        route_url = f"{self._account_url}/state"
 
         response_json = self._request("get", route_url)
         account_state_values = get_nested_key(response_json, ["d", "accountDetailsData"])
@@ -1103,6 +1265,28 @@ class TLAPI:
         )
         return account_state
 
+    @log_func
+    @tl_typechecked
+    def get_account_state_tuple(self) -> AccountState:
+        """Returns the account state as a lightweight AccountState named tuple.
+
+        Cheaper than get_account_state for tight polling loops: the fixed field
+        schema lives in tuple slots instead of a per-call hash table.
+
+        Route Name: GET_ACCOUNT_STATE
+
+        Returns:
+            AccountState: The account state
+        """
+        route_url = f"{self._account_url}/state"
+
+        response_json = self._request("get", route_url)
+        account_state_values = get_nested_key(response_json, ["d", "accountDetailsData"])
+        # Keyword construction keeps us independent of the config column order
+        return AccountState(
+            **dict(zip(self._get_column_names("accountDetailsConfig"), account_state_values))
+        )
+
     ############################## INSTRUMENT ROUTES #######################
 
     @disk_or_memory_cache(cache_validation_callback=expires_after(days=1))
@@ -1135,6 +1319,7 @@ class TLAPI:
         )
         return instrument_details
 
+    @lru_cache
     @log_func
     @tl_typechecked
     def get_session_details(self, session_id: int) -> SessionDetailsType:
@@ -1156,6 +1341,7 @@ class TLAPI:
         )
         return session_details
 
+    @lru_cache
     @log_func
     @tl_typechecked
     def get_session_status_details(self, session_status_id: int) -> SessionStatusDetailsType:
@@ -1195,7 +1381,7 @@ class TLAPI:
         Returns:
             DailyBarType: Daily candle data
         """
-        route_url = f"{self.get_base_url()}/trade/dailyBar"
+        route_url = self._daily_bar_url
         additional_params: DictValuesType = {
             "tradableInstrumentId": instrument_id,
             "routeId": self.get_info_route_id(instrument_id),
@@ -1219,7 +1405,7 @@ class TLAPI:
         Returns:
             MarketDepthlistType: Market depth data
         """
-        route_url = f"{self.get_base_url()}/trade/depth"
+        route_url = self._depth_url
 
         additional_params: DictValuesType = {
             "tradableInstrumentId": instrument_id,
@@ -1243,7 +1429,7 @@ class TLAPI:
            which can cause the same function params to require a different answer.
         This is a helper function for get_price_history, which does not have these params and is thus cacheable.
         """
-        route_url = f"{self.get_base_url()}/trade/history"
+        route_url = self._history_url
 
         additional_params = {
             "tradableInstrumentId": instrument_id,
@@ -1283,8 +1469,88 @@ class TLAPI:
         Returns:
             pd.DataFrame[PriceHistoryColumnsTypes]: DataFrame containing instrument's historical data
         """
-        route_url = f"{self.get_base_url()}/trade/history"
+        bar_rows = self._fetch_bar_rows(
+            instrument_id, resolution, lookback_period, start_timestamp, end_timestamp
+        )
+
+        if not bar_rows:
+            # Specify column names to make sure they exist even for empty returns
+            return pd.DataFrame(columns=["t", "o", "h", "l", "c", "v"])
+
+        # Build one typed array per column instead of letting pandas probe every
+        # row dict and infer dtypes -- much cheaper for large histories
+        bar_details = pd.DataFrame(
+            {
+                column: np.asarray([row[column] for row in bar_rows], dtype=column_type)
+                for column, column_type in PriceHistoryColumns.items()
+            }
+        )
+
+        return bar_details
+
+    @log_func
+    @tl_typechecked
+    def get_price_history_arrow(
+        self,
+        instrument_id: int,
+        resolution: ResolutionType = "15m",
+        lookback_period: str = "",
+        start_timestamp: int = 0,  # timestamps are in miliseconds!
+        end_timestamp: int = 0,
+    ) -> Any:
+        """Returns price history data as a pyarrow.Table, bypassing pandas entirely.
 
+        Requires the optional pyarrow dependency -- install it manually if you want
+        to feed the bar data into polars/duckdb without a pandas detour.
+
+        Route Name: QUOTES_HISTORY
+
+        Args:
+            instrument_id (int): Instrument Id
+            resolution (ResolutionType, optional): Data resolution. Defaults to "15m".
+            lookback_period (str, optional): Lookback period (for example "5m"). Defaults to "".
+            start_timestamp (int, optional): Start timestamp (in ms). Defaults to 0.
+            end_timestamp: (int, optional): End timestamp (in ms). Defaults to 0.
+
+        Raises:
+            ImportError: Will be raised if pyarrow is not installed
+            ValueError: Will be raised on a invalid response
+
+        Returns:
+            pyarrow.Table: Table containing instrument's historical data
+        """
+        try:
+            import pyarrow as pa  # type: ignore[import]
+        except ImportError as err:
+            raise ImportError(
+                "pyarrow must be installed to use get_price_history_arrow"
+            ) from err
+
+        bar_rows = self._fetch_bar_rows(
+            instrument_id, resolution, lookback_period, start_timestamp, end_timestamp
+        )
+
+        arrow_types = {"t": pa.int64()}
+        return pa.table(
+            {
+                column: pa.array(
+                    [row[column] for row in bar_rows],
+                    type=arrow_types.get(column, pa.float64()),
+                )
+                for column in PriceHistoryColumns
+            }
+        )
+
+    @tl_typechecked
+    def _fetch_bar_rows(
+        self,
+        instrument_id: int,
+        resolution: ResolutionType,
+        lookback_period: str,
+        start_timestamp: int,
+        end_timestamp: int,
+    ) -> list[Any]:
+        """Validates the requested range and returns the raw barDetails rows."""
         start_timestamp, end_timestamp = resolve_lookback_and_timestamps(
             lookback_period, start_timestamp, end_timestamp
         )
@@ -1304,19 +1570,14 @@ class TLAPI:
             to=end_timestamp,
         )
 
-        try:
-            bar_details = pd.DataFrame(get_nested_key(response_json, ["d", "barDetails"]))
-        except KeyError as err:
-            if response_json["s"] == "no_data":
-                self.log.warning("No data returned from the API for the given period")
-                # Specify column names to make sure they exist even for empty returns
-                bar_details = pd.DataFrame(columns=["t", "o", "h", "l", "c", "v"])
-            else:
-                raise err
+        # "no_data" is a normal response, so check for it explicitly instead of
+        # letting the missing-key exception double as control flow
+        if response_json.get("s") == "no_data":
+            self.log.warning("No data returned from the API for the given period")
+            return []
 
-        self._apply_typing(bar_details, PriceHistoryColumns)
-
-        return bar_details
+        bar_rows: list[Any] = get_nested_key(response_json, ["d", "barDetails"])
+        return bar_rows
 
     @log_func
     @tl_typechecked
@@ -1361,7 +1622,7 @@ class TLAPI:
         Returns:
             QuotesType: Price quotes for instrument
         """
-        route_url = f"{self.get_base_url()}/trade/quotes"
+        route_url = self._quotes_url
 
         additional_params: DictValuesType = {
             "tradableInstrumentId": instrument_id,
@@ -1371,6 +1632,31 @@ class TLAPI:
         latest_price: QuotesType = get_nested_key(response_json, ["d"], QuotesType)
         return latest_price
 
+    @log_func
+    @tl_typechecked
+    def get_quotes_bulk(self, instrument_ids: list[int]) -> dict[int, QuotesType]:
+        """Returns price quotes for several instruments at once.
+
+        The per-instrument quote requests are independent, so they are issued
+        concurrently over the shared session -- roughly one round trip for the
+        whole batch instead of one per instrument.
+
+        Args:
+            instrument_ids (list[int]): Instrument Ids to fetch quotes for
+
+        Returns:
+            dict[int, QuotesType]: Price quotes keyed by instrument id
+        """
+        if not instrument_ids:
+            return {}
+
+        # Refresh the access token up front so the worker threads don't race to do it
+        self.get_access_token()
+
+        with ThreadPoolExecutor(max_workers=min(8, len(instrument_ids))) as executor:
+            all_quotes = executor.map(self.get_quotes, instrument_ids)
+            return dict(zip(instrument_ids, all_quotes))
+
     @log_func
     @tl_typechecked
     def _perform_order_netting(
@@ -1392,27 +1678,40 @@ class TLAPI:
         """
         opposite_side: str = "sell" if (new_position_side == "buy") else "buy"
 
-        all_positions = self.get_all_positions()
-        opposite_positions = all_positions.loc[
-            (
-                (all_positions["tradableInstrumentId"] == instrument_id)
-                & (all_positions["side"] == opposite_side)
-            )
+        # Work on the raw (server-side filtered) rows -- netting does not need the
+        # DataFrame construction and typing pass of get_all_positions
+        column_index = {
+            name: idx for idx, name in enumerate(self._get_column_names("positionsConfig"))
+        }
+        # Resolve the column positions once, outside the per-position loop
+        id_idx = column_index["id"]
+        side_idx = column_index["side"]
+        qty_idx = column_index["qty"]
+        stop_loss_idx = column_index["stopLossId"]
+        take_profit_idx = column_index["takeProfitId"]
+
+        raw_positions = self._get_positions_raw(instrument_id_filter=instrument_id)
+        opposite_positions = [
+            position for position in raw_positions if position[side_idx] == opposite_side
         ]
 
         # Sort opposite positions by qty (ascending)
-        opposite_positions = opposite_positions.sort_values(by="qty")
+        opposite_positions.sort(key=lambda position: float(position[qty_idx]))
 
         total_netted: float = 0
-        for _, position in opposite_positions.iterrows():
-            if not position["stopLossId"] and not position["takeProfitId"]:
+        for position in opposite_positions:
+            if not position[stop_loss_idx] and not position[take_profit_idx]:
                 # Compute how much to close in case a partial close would be needed
-                quantity_to_close = min(position["qty"], float(quantity) - total_netted)
+                position_qty = float(position[qty_idx])
+                quantity_to_close = min(position_qty, float(quantity) - total_netted)
 
                 self.log.info(
                     "Closing position {position_id}, {quantity_to_close} due to position_netting order {order}"
                 )
-                self.close_position(position_id=position["id"], close_quantity=quantity_to_close)
+                self.close_position(
+                    position_id=int(position[id_idx]),
+                    close_quantity=quantity_to_close,
+                )
                 total_netted += quantity_to_close
 
                 # If sufficient orders have been placed, return
@@ -1467,7 +1766,7 @@ class TLAPI:
             TLAPIException: Will be raised if the request failed or no valid json received.
             TLAPIOrderException: Will be raised if broker rejected the order.
         """
-        route_url = f"{self.get_base_url()}/trade/accounts/{self.account_id}/orders"
+        route_url = f"{self._account_url}/orders"
 
         if type_ == "market" and price:
             self.log.warning("Price specified for a market order. Ignoring the price.")
@@ -1516,13 +1815,15 @@ class TLAPI:
             self.log.error(error_msg)
             raise ValueError(error_msg)
 
+        # Numeric values are passed natively and serialized by the JSON encoder,
+        # instead of being stringified here and re-parsed by the backend
         request_body: dict[str, Any] = {
             "price": price,
-            "qty": str(quantity),
+            "qty": quantity,
             "routeId": self.get_trade_route_id(instrument_id),
             "side": side,
             "validity": validity,
-            "tradableInstrumentId": str(instrument_id),
+            "tradableInstrumentId": instrument_id,
             "type": type_,
             "takeProfit": take_profit,
             "takeProfitType": take_profit_type,
@@ -1540,8 +1841,8 @@ class TLAPI:
             if type_ == "market":
                 total_netted = self._perform_order_netting(instrument_id, side, quantity)
                 # Reduce the necessary quantity by the total_amount that was netted
-                request_body["qty"] = str(float(request_body["qty"]) - total_netted)
-                if float(request_body["qty"]) < self._MIN_LOT_SIZE:
+                request_body["qty"] = float(quantity) - total_netted
+                if request_body["qty"] < self._MIN_LOT_SIZE:
                     self.log.info(
                         "Not placing a new order after closing sufficient opposite orders due to netting."
                     )
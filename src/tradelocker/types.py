@@ -1,5 +1,7 @@
-from typing import TypeAlias as TA, Literal, Optional
+from collections import namedtuple
+from typing import Any, TypeAlias as TA, Literal, Optional
 from numpy import int64
+import pandas as pd
 
 # Custom type aliases
 RequestsMappingType: TA = dict[str, str | bytes]
@@ -89,6 +91,17 @@ QuotesKeyType: TA = Literal["ap", "bp", "as", "bs"]
 QuotesType: TA = dict[QuotesKeyType, float]
 
 
+# Categorical dtypes for the closed Literal-valued DataFrame columns.
+# Categoricals are far cheaper to store and compare than object-dtype strings.
+SideCategory = pd.CategoricalDtype(["buy", "sell"])
+OrderTypeCategory = pd.CategoricalDtype(["limit", "market", "stop"])
+ValidityCategory = pd.CategoricalDtype(["GTC", "IOC"])
+# "status" has an open-ended value set, so its categories are inferred from
+# each response rather than fixed up front; equality against a literal then
+# compares category codes instead of strings
+StatusCategory = pd.CategoricalDtype()
+
+
 AccountsColumns: dict[str, type] = {
     "id": int64,
     "name": str,
@@ -97,10 +110,10 @@ AccountsColumns: dict[str, type] = {
     "accountBalance": float,
 }
 
-ExecutionsColumns: dict[str, type] = {
+ExecutionsColumns: dict[str, Any] = {
     "id": int64,
     "price": float,
-    "side": SideType,
+    "side": SideCategory,
     "createdDate": int64,
     "qty": float,
     "orderId": int64,
@@ -108,19 +121,19 @@ ExecutionsColumns: dict[str, type] = {
     "tradableInstrumentId": int64,
 }
 
-OrdersColumns: dict[str, type] = {
+OrdersColumns: dict[str, Any] = {
     "id": int64,
     "tradableInstrumentId": int64,
     "routeId": int64,
     "qty": float,
-    "side": SideType,
-    "type": OrderTypeType,
-    "status": str,
+    "side": SideCategory,
+    "type": OrderTypeCategory,
+    "status": StatusCategory,
     "filledQty": float,
     "avgPrice": float,
     "price": float,
     "stopPrice": float,
-    "validity": ValidityType,
+    "validity": ValidityCategory,
     "expireDate": int64,
     "createdDate": int64,
     "lastModified": int64,
@@ -133,11 +146,11 @@ OrdersColumns: dict[str, type] = {
     "strategyId": str,
 }
 
-PositionsColumns: dict[str, type] = {
+PositionsColumns: dict[str, Any] = {
     "id": int64,
     "tradableInstrumentId": int64,
     "routeId": int64,
-    "side": SideType,
+    "side": SideCategory,
     "qty": float,
     "avgPrice": float,
     "stopLossId": int64,
@@ -203,3 +216,8 @@ AccountDetailsColumns: dict[str, type] = {
 }
 
 order_history_statuses = ["Filled", "Cancelled", "Refused", "Unplaced", "Removed"]
+
+# Slot-based account state record; cheaper to build and read than a per-call dict.
+# mypy cannot resolve dynamic namedtuple field lists; keeping the single source
+# of truth in AccountDetailsColumns wins over duplicating it statically.
+AccountState = namedtuple("AccountState", list(AccountDetailsColumns))  # type: ignore[misc]
@@ -1,13 +1,13 @@
 from functools import wraps, lru_cache
 import inspect
-from typing import Any, Callable, TypeVar, cast
-import datetime
+from types import MappingProxyType
+from typing import Any, Callable, Optional, TypeVar, cast
 import logging as logging_module
 import time
 import os
 
-from dotenv import dotenv_values
-import jwt
+import numpy as np
+from numpy.typing import NDArray
 
 from requests.exceptions import RequestException
 from tradelocker.types import ResolutionType, LogLevelType
@@ -17,15 +17,24 @@ from tradelocker.types import ResolutionType, LogLevelType
 RT = TypeVar("RT")  # Return Type
 
 # ----------- Import conditional dependencies ---------------
-try:
-    # Try importing typechecked from typeguard
-    logging_module.info("typechecked imported from typeguard")
-    from typeguard import typechecked as tl_typechecked
+# Runtime typechecking is on by default but can be switched off without
+# rebuilding: either run under `python -O` or set TL_TYPECHECK=0. On hot
+# per-call methods the typeguard wrapper is pure overhead in production.
+if __debug__ and os.environ.get("TL_TYPECHECK", "1") != "0":
+    try:
+        # Try importing typechecked from typeguard
+        logging_module.info("typechecked imported from typeguard")
+        from typeguard import typechecked as tl_typechecked
 
-except ImportError:
-    logging_module.info("typechecked defined as a noop decatorator")
+    except ImportError:
+        logging_module.info("typechecked defined as a noop decatorator")
+
+        # If it fails, define a noop decorator
+        def tl_typechecked(func: Callable[..., RT]) -> Callable[..., RT]:
+            return func
+
+else:
 
-    # If it fails, define a noop decorator
     def tl_typechecked(func: Callable[..., RT]) -> Callable[..., RT]:
         return func
 
@@ -38,28 +47,50 @@ except ImportError:
         pass
 
 
+try:
+    # orjson parses large payloads ~3x faster; fall back to stdlib json if not installed
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+# Assignment (rather than import-as) so the name is an explicit export under
+# mypy's strict no-implicit-reexport
+tl_json_loads = _json_loads
+
+
 # ------------------------------------------------------------
 
 # Constants
 MS_COEFF = 1000
-RESOLUTION_COEFF_MS = {
-    "s": 1 * MS_COEFF,
-    "m": 60 * MS_COEFF,
-    "H": 60 * 60 * MS_COEFF,
-    "D": 24 * 60 * 60 * MS_COEFF,
-    "W": 7 * 24 * 60 * 60 * MS_COEFF,
-    "M": 30 * 24 * 60 * 60 * MS_COEFF,
-    "Y": 365 * 24 * 60 * 60 * MS_COEFF,
-}
+# Read-only view: nothing should mutate the suffix table after import
+RESOLUTION_COEFF_MS = MappingProxyType(
+    {
+        "s": 1 * MS_COEFF,
+        "m": 60 * MS_COEFF,
+        "H": 60 * 60 * MS_COEFF,
+        "D": 24 * 60 * 60 * MS_COEFF,
+        "W": 7 * 24 * 60 * 60 * MS_COEFF,
+        "M": 30 * 24 * 60 * 60 * MS_COEFF,
+        "Y": 365 * 24 * 60 * 60 * MS_COEFF,
+    }
+)
+# Stringified once for error messages, instead of materializing a keys view
+# on every failed parse
+_VALID_SUFFIXES_STR = ", ".join(RESOLUTION_COEFF_MS)
 
 # Default logging if setup_utils_logging was not called
 logging = logging_module
 
+# Resolved once here rather than on every log_func call; setup_utils_logging
+# keeps it in sync with the `logging` global above
+_log_target: logging_module.Logger = logging_module.root
+
 
 # Overwrites the logging module
 def setup_utils_logging(logger: logging_module.Logger) -> None:
-    global logging
+    global logging, _log_target
     logging = logger
+    _log_target = logger
 
 
 def get_logger(name: str, log_level: LogLevelType, format: str) -> logging_module.Logger:
@@ -79,41 +110,97 @@ def always_return_true(*args, **kwargs):
     return True
 
 
+# Bounded repr for logging: repr() of a large DataFrame or JSON payload
+# materializes the whole structure just to be truncated, so summarize
+# anything with a shape or more than 100 elements by type and size instead
+def _cheap_repr(value: Any) -> str:
+    if hasattr(value, "shape"):
+        return f"<{type(value).__name__} shape={value.shape}>"
+    if isinstance(value, (list, tuple, set, dict)) and len(value) > 100:
+        return f"<{type(value).__name__} len={len(value)}>"
+    return repr(value)
+
+
 # This decorator logs the function call and its arguments
 def log_func(func: Callable[..., RT]) -> Callable[..., RT]:
+    func_name = func.__name__
+
     @wraps(func)
     def wrapper(*args: Any, **kwargs: Any) -> RT:
-        args_repr = [repr(a) for a in args]
-        kwargs_repr = [f"{k}={v!r}" for k, v in kwargs.items()]
+        # Skip all argument/return repr work when debug logging is off --
+        # repr of DataFrames alone can dwarf the wrapped call itself
+        logger = _log_target
+        if not logger.isEnabledFor(logging_module.DEBUG):
+            return func(*args, **kwargs)
+
+        args_repr = [_cheap_repr(a) for a in args]
+        kwargs_repr = [f"{k}={_cheap_repr(v)}" for k, v in kwargs.items()]
         signature = ", ".join(args_repr + kwargs_repr)
 
-        logging.debug(f"**** CALLING {func.__name__}({signature})")
+        # Lazy %s-style formatting lets the logging framework skip the final
+        # string assembly if a handler rejects the record
+        logger.debug("**** CALLING %s(%s)", func_name, signature)
 
         return_value = func(*args, **kwargs)
 
         max_return_string_length = 1000
-        return_string = repr(return_value)
+        return_string = _cheap_repr(return_value)
         if len(return_string) > max_return_string_length:
             return_string = (
                 return_string[:max_return_string_length]
                 + "    ...   ===<< TRUNCATED DUE TO LENGTH >>===   "
             )
-        logging.debug(f"**** RETURN from {func.__name__}({signature}):\n{return_string}")
+        logger.debug("**** RETURN from %s(%s):\n%s", func_name, signature, return_string)
 
         return return_value
 
     return cast(Callable[..., RT], wrapper)
 
 
-def has_parameter(func, param_name):
-    signature = inspect.signature(func)
-    return param_name in signature.parameters
+# Parameter names are immutable per function object, so resolve the (slow)
+# inspect.signature once and answer repeat queries from a frozenset
+@lru_cache(maxsize=256)
+def _signature_params(func: Callable[..., Any]) -> frozenset[str]:
+    return frozenset(inspect.signature(func).parameters)
+
+
+def has_parameter(func: Callable[..., Any], param_name: str) -> bool:
+    return param_name in _signature_params(func)
+
+
+# In-memory fallback for disk_or_memory_cache. Unlike lru_cache it leaves
+# self out of the key -- the cache is already per-instance -- so hashing only
+# covers the real arguments. Eviction is simple FIFO via dict insertion order.
+def _memory_cache(func: Callable[..., RT], max_entries: int = 128) -> Callable[..., RT]:
+    cache: dict[tuple[Any, ...], RT] = {}
+
+    @wraps(func)
+    def memoized(*args: Any, **kwargs: Any) -> RT:
+        key = (args[1:], tuple(sorted(kwargs.items())))
+        try:
+            if key in cache:
+                return cache[key]
+        except TypeError:
+            # Unhashable argument (e.g. a list): run uncached rather than
+            # throwing through the cache internals
+            return func(*args, **kwargs)
+        result = func(*args, **kwargs)
+        if len(cache) >= max_entries:
+            cache.pop(next(iter(cache)))
+        cache[key] = result
+        return result
+
+    return memoized
 
 
 # Use disk_cache (joblib) if self._disk_cache is set, otherwise uses lru_cache
-def disk_or_memory_cache(cache_validation_callback=None):
-    def decorator(func):
-        # Get the original function signature
+def disk_or_memory_cache(
+    cache_validation_callback: Optional[Callable[..., Any]] = None,
+) -> Callable[[Callable[..., RT]], Callable[..., RT]]:
+    def decorator(func: Callable[..., RT]) -> Callable[..., RT]:
+        # All the signature synthesis happens once at decoration time;
+        # inspect.signature and Signature.replace are far too slow to sit on
+        # the per-call path
         sig = inspect.signature(func)
         # Create a new parameter for '_cache_key'
         cache_key_param = inspect.Parameter(
@@ -123,42 +210,48 @@ def disk_or_memory_cache(cache_validation_callback=None):
         new_params = [*sig.parameters.values(), cache_key_param]
         new_sig = sig.replace(parameters=new_params)
 
+        # Define a new function with the updated signature
         @wraps(func)
-        def wrapper(*args, **kwargs):
-            cache_attr = f"__cached_{func.__name__}"
+        def func_with_cache_key(*args: Any, _cache_key: Any = None, **kwargs: Any) -> RT:
+            return func(*args, **kwargs)
+
+        # Assign the new signature to the function
+        func_with_cache_key.__signature__ = new_sig  # type: ignore[attr-defined]
+        func_with_cache_key.__name__ = func.__name__ + "_with_cache_key"
+
+        # Deliberately stored as an instance attribute rather than in a
+        # decoration-level WeakKeyDictionary: the lru_cache built below keeps
+        # self in its keys, so a long-lived weak-keyed map would hold every
+        # instance alive through its own cache. The attribute form is only a
+        # self-cycle, which the gc can reclaim.
+        cache_attr = f"__cached_{func.__name__}"
+
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> RT:
             if len(args) == 0:
                 raise ValueError(
                     "Decorator must be used with a class method. First argument must be 'self'"
                 )
             self = args[0]
 
-            # Define a new function with the updated signature
-            @wraps(func)
-            def func_with_cache_key(*args, _cache_key=None, **kwargs):
-                return func(*args, **kwargs)
-
-            # Assign the new signature to the function
-            func_with_cache_key.__signature__ = new_sig
-            func_with_cache_key.__name__ = func.__name__ + "_with_cache_key"
-
-            if not hasattr(self, cache_attr):
-                if hasattr(self, "_disk_cache") and self._disk_cache is not None:
+            # EAFP: a single attribute access on the hot (already-built) path
+            try:
+                cached_func_applied_self = getattr(self, cache_attr)
+            except AttributeError:
+                if getattr(self, "_disk_cache", None) is not None:
                     cached_func_applied_self = self._disk_cache.cache(
                         ignore=["self"], cache_validation_callback=cache_validation_callback
                     )(func_with_cache_key)
                     logging.debug(f"Creating disk cache for {func.__name__}")
                 else:
-                    cached_func_applied_self = lru_cache()(func_with_cache_key)
+                    cached_func_applied_self = _memory_cache(func_with_cache_key)
                     logging.debug(f"Creating memory cache for {func.__name__}")
 
                 setattr(self, cache_attr, cached_func_applied_self)
-            else:
-                cached_func_applied_self = getattr(self, cache_attr)
 
             # Add '_cache_key' to kwargs
             kwargs["_cache_key"] = getattr(self, "_cache_key", None)
-            response = cached_func_applied_self(*args, **kwargs)
-            return response
+            return cast(RT, cached_func_applied_self(*args, **kwargs))
 
         return wrapper
 
@@ -170,28 +263,67 @@ def retry(func: Callable[..., RT], delay: float = 1) -> Callable[..., RT]:
     def wrapper(*args: Any, **kwargs: Any) -> RT:
         max_retries = 3
 
+        # Sleep only after a failure, doubling each time -- the happy path
+        # pays nothing, while repeat failures back off instead of hammering
+        last_err: RequestException
         for attempt in range(max_retries):
-            time.sleep(delay)  # Must be below delay limit
             try:
                 return func(*args, **kwargs)
             except RequestException as err:
+                last_err = err
                 logging.warning(f"Retry #{attempt}, Error: {err}, retrying...")
-        return func(*args, **kwargs)
+                if attempt < max_retries - 1:
+                    time.sleep(delay * (2**attempt))
+        # All attempts failed; surface the real error instead of making a
+        # fourth, uncounted call
+        raise last_err
 
     return cast(Callable[..., RT], wrapper)
 
 
+# "now" cache: a burst of requests issued within the same millisecond (one
+# per symbol in a batched fetch, say) shares a single epoch-ms conversion
+_NOW_CACHE: dict[str, int] = {"ns": 0, "ms": 0}
+
+
+def _now_ms() -> int:
+    # Integer ns clock: no float multiply or rounding on the way to epoch-ms
+    now_ns = time.time_ns()
+    if now_ns - _NOW_CACHE["ns"] < 1_000_000:
+        return _NOW_CACHE["ms"]
+    now_ms = now_ns // 1_000_000
+    _NOW_CACHE["ns"] = now_ns
+    _NOW_CACHE["ms"] = now_ms
+    return now_ms
+
+
+# Missing-key sentinel for get_nested_key; lets dict.get do one hash lookup
+# per level instead of a membership test followed by a subscript
+_MISSING: Any = object()
+
+
 # Returns the value of a nested key in a JSON object
 @tl_typechecked
 def get_nested_key(
     json_data: dict[str, Any], keys: list[str], return_type_assertion: Any = None
 ) -> Any:
+    # Fast path for the ubiquitous two-key lookup with no type assertion:
+    # two plain dict subscripts instead of the generic loop below
+    if return_type_assertion is None and len(keys) == 2:
+        try:
+            return json_data[keys[0]][keys[1]]
+        except (KeyError, TypeError):
+            pass  # fall through to the loop for the detailed error message
+
     current_data: Any = json_data
     for key in keys:
-        if key not in current_data:
+        # A non-dict intermediate (e.g. a list) is reported the same way as a
+        # missing key, not as an AttributeError from .get
+        next_data = current_data.get(key, _MISSING) if isinstance(current_data, dict) else _MISSING
+        if next_data is _MISSING:
             raise KeyError(f"Key {key} ({keys}) missing from JSON data {str(json_data)}")
 
-        current_data = current_data[key]
+        current_data = next_data
 
     if return_type_assertion:
         # check whether current_data is of type return_type_assertion
@@ -200,22 +332,55 @@ def get_nested_key(
     return current_data
 
 
-@tl_typechecked
-def timestamps_from_lookback(lookback_period: str) -> tuple[int, int]:
+# Pure numeric helpers below are called on every history fetch; runtime
+# typechecking stays at the TLAPI boundary where user input actually enters
+# Unit suffixes are single ASCII chars, so resolve them with an array indexed
+# by ordinal -- one bounds-checked subscript instead of a dict hash + compare
+_COEFF_BY_ORD: list[int] = [0] * 128
+for _suffix, _coeff_ms in RESOLUTION_COEFF_MS.items():
+    _COEFF_BY_ORD[ord(_suffix)] = _coeff_ms
+
+
+# The same handful of strings ("1D", "15m", ...) recurs across calls, so the
+# slicing, int() parse and suffix lookup are worth memoizing
+@lru_cache(maxsize=64)
+def _parse_lookback(lookback_period: str) -> tuple[int, int]:
+    """Parses "<num><unit>" into (num, unit_coefficient_in_ms)."""
     assert (
         len(lookback_period) > 1
     ), f"lookback_period ({lookback_period}) must be at least 2 characters long"
 
-    lookback_period_num = int(lookback_period[:-1])
-
-    if lookback_period[-1] not in RESOLUTION_COEFF_MS:
+    suffix_ord = ord(lookback_period[-1])
+    coeff_ms = _COEFF_BY_ORD[suffix_ord] if suffix_ord < 128 else 0
+    if coeff_ms == 0:
         raise ValueError(
-            f"last character ({lookback_period[-1]}) not among {RESOLUTION_COEFF_MS.keys()}"
+            f"last character ({lookback_period[-1]}) not among {_VALID_SUFFIXES_STR}"
         )
 
-    end_timestamp = int(datetime.datetime.now().timestamp() * MS_COEFF)
+    return int(lookback_period[:-1]), coeff_ms
+
+
+# Callers that walk the same literal path over many records can precompile it
+# into one chained-subscript accessor -- no per-record list iteration
+@lru_cache(maxsize=64)
+def compile_path(keys: tuple[str, ...]) -> Callable[[dict[str, Any]], Any]:
+    """Compiles a fixed key path into a fast accessor, e.g. ("d", "price") -> lambda j: j["d"]["price"]."""
+    subscripts = "".join(f"[{key!r}]" for key in keys)
+    # eval of a literal-only lambda built from our own repr'd keys
+    return cast(
+        Callable[[dict[str, Any]], Any],
+        eval(f"lambda json_data: json_data{subscripts}"),  # pylint: disable=eval-used
+    )
+
+
+def timestamps_from_lookback(lookback_period: str) -> tuple[int, int]:
+    lookback_period_num, coeff_ms = _parse_lookback(lookback_period)
+
+    # time.time() is a single C call; datetime.now().timestamp() would allocate
+    # a datetime object and round-trip through the tz machinery for the same value
+    end_timestamp = _now_ms()
     # Depending on the lookback_period, we need to calculate the start_timestamp
-    start_timestamp = end_timestamp - lookback_period_num * RESOLUTION_COEFF_MS[lookback_period[-1]]
+    start_timestamp = end_timestamp - lookback_period_num * coeff_ms
 
     logging.debug(f"start_timestamp: {start_timestamp}")
     logging.debug(f"end_timestamp: {end_timestamp}")
@@ -223,18 +388,16 @@ def timestamps_from_lookback(lookback_period: str) -> tuple[int, int]:
     return start_timestamp, end_timestamp
 
 
+@lru_cache(maxsize=32)
 def convert_resolution_to_mins(resolution: ResolutionType) -> int:
     # if last character is "m", then it is minutes, "H" is for hours, "D" for days, W weeks, M monthts
-    if resolution[-1] in RESOLUTION_COEFF_MS:
-        val = int(resolution[:-1])
-        val_ms = val * RESOLUTION_COEFF_MS[resolution[-1]]
-        if val_ms < 60 * 1000:
-            raise ValueError(f"Resolution {resolution} is too small. Minimum is 1 minute.")
-        return_value = val_ms // (60 * 1000)
-        logging.debug(f"Converted {resolution} to minutes: {return_value}")
-        return return_value
-
-    raise ValueError(f"last character of {resolution[-1]} not among {RESOLUTION_COEFF_MS.keys()}")
+    val, coeff_ms = _parse_lookback(resolution)
+    val_ms = val * coeff_ms
+    if val_ms < 60 * 1000:
+        raise ValueError(f"Resolution {resolution} is too small. Minimum is 1 minute.")
+    return_value = val_ms // (60 * 1000)
+    logging.debug(f"Converted {resolution} to minutes: {return_value}")
+    return return_value
 
 
 @tl_typechecked
@@ -246,11 +409,10 @@ def resolve_lookback_and_timestamps(
     """
     # If end_timestamp is 0, we can assume that we want to get data until now
     if end_timestamp == 0:
-        end_timestamp = int(datetime.datetime.now().timestamp() * MS_COEFF)
+        end_timestamp = _now_ms()
 
-    valid_timestamps = (
-        start_timestamp != 0 and end_timestamp != 0 and start_timestamp <= end_timestamp
-    )
+    # end_timestamp is guaranteed non-zero past this point
+    valid_timestamps = start_timestamp != 0 and start_timestamp <= end_timestamp
     if valid_timestamps:
         if lookback_period != "":
             logging.warning(
@@ -268,51 +430,108 @@ def resolve_lookback_and_timestamps(
         ) from e
 
 
-@tl_typechecked
 def estimate_history_size(
     start_timestamp: int, end_timestamp: int, resolution: ResolutionType
 ) -> int:
-    total_miliseconds: float = end_timestamp - start_timestamp
-    coeff = int(resolution[:-1]) * RESOLUTION_COEFF_MS[resolution[-1]]
-    total_bars: int = int(total_miliseconds / coeff)
+    total_miliseconds: int = end_timestamp - start_timestamp
+    resolution_num, coeff_ms = _parse_lookback(resolution)
+    coeff = resolution_num * coeff_ms
+    # Floor division keeps everything in the integer domain -- no float
+    # round-trip, exact for timestamps beyond 2**53
+    total_bars: int = total_miliseconds // coeff
     return total_bars
 
 
+def estimate_history_size_batch(
+    start_timestamps: Any, end_timestamps: Any, resolution: ResolutionType
+) -> NDArray[np.int64]:
+    """Vectorized estimate_history_size for sizing history across many ranges.
+
+    One numpy subtraction and floor division over the whole batch replaces a
+    Python-level call per range.
+    """
+    resolution_num, coeff_ms = _parse_lookback(resolution)
+    starts = np.asarray(start_timestamps, dtype=np.int64)
+    ends = np.asarray(end_timestamps, dtype=np.int64)
+    return (ends - starts) // (resolution_num * coeff_ms)
+
+
+# The exp claim is immutable per token, so decode each token only once.
+# maxsize 8 is plenty for token rotation while keeping the cache bounded.
+@lru_cache(maxsize=8)
+def _extract_token_expiration(access_token: str) -> float:
+    # Deferred import: consumers that never authenticate through this module
+    # skip loading jwt at import time (sys.modules makes repeats free)
+    import jwt
+
+    # No explicit need to verify the signature as there is a direct https connection between the client and the server
+    decoded_payload: dict[str, Any] = jwt.decode(access_token, options={"verify_signature": False})
+    expiration_time: float = decoded_payload["exp"]
+    return expiration_time
+
+
 @tl_typechecked
 def time_to_token_expiry(access_token: str) -> float:
     if not access_token:
         logging.warning(f"invalid access token: |{access_token}|")
         return 0
 
-    # No explicit need to verify the signature as there is a direct https connection between the client and the server
-    decoded_payload: dict[str, Any] = jwt.decode(access_token, options={"verify_signature": False})
-    expiration_time: float = decoded_payload["exp"]
-    remaining_time: float = expiration_time - datetime.datetime.now().timestamp()
+    remaining_time: float = _extract_token_expiration(access_token) - _now_ms() / MS_COEFF
     return remaining_time
 
 
+# Parsed .env files keyed by path, with the file mtime for invalidation
+_ENV_CACHE: dict[str, tuple[float, dict[str, str | int]]] = {}
+
+
+# The abspath/dirname/join dance is pure string work on constant inputs, so
+# resolve each caller's default path once
+@lru_cache(maxsize=16)
+def _default_env_path(callers_file: str, backup_env_file: str) -> str:
+    script_dir = os.path.abspath(os.path.dirname(callers_file))
+    return os.path.join(script_dir, backup_env_file)
+
+
 @tl_typechecked
 # Should be called with callers_file = __file__
 def load_env_config(callers_file: str, backup_env_file=".env") -> dict[str, str | int]:
     """Load the .env file from the path defined in ENV_FILE_PATH or the backup_env_file, relative to current dir"""
 
-    # Get the current script's directory
-    script_dir = os.path.abspath(os.path.dirname(callers_file))
-
     env_var_name = "ENV_FILE_PATH"
 
     # read the "$(env_var_name)" environment variable if it exists, otherwise use .env or .env-test
-    env_path = os.environ.get(env_var_name, os.path.join(script_dir, backup_env_file))
+    env_path = os.environ.get(env_var_name) or _default_env_path(callers_file, backup_env_file)
+
+    # Reuse the parsed result while the file is unchanged -- repeat calls skip
+    # the disk read and dotenv parse entirely
+    try:
+        mtime = os.path.getmtime(env_path)
+    except FileNotFoundError:
+        mtime = -1.0
+
+    cached = _ENV_CACHE.get(env_path)
+    if cached is not None and cached[0] == mtime:
+        return dict(cached[1])
+
+    # Deferred import, mirroring jwt above: only .env users pay for dotenv
+    from dotenv import dotenv_values
 
     # Load the .env file from that directory
     config: dict[str, str] = dotenv_values(env_path)
     if "tl_acc_num" not in config:
         config["tl_acc_num"] = 0
 
-    return config
+    _ENV_CACHE[env_path] = (mtime, config)
+    # Hand out a copy so caller mutations can't poison the cache
+    return dict(config)
+
+
+# Resolution -> frequency rank (most frequent first), computed once
+_RESOLUTION_RANK = {
+    resolution: rank
+    for rank, resolution in enumerate(["1m", "5m", "15m", "30m", "1H", "4H", "1D", "1W", "1M"])
+}
 
 
-@tl_typechecked
 def is_more_frequent(resolution1: ResolutionType, resolution2: ResolutionType) -> bool:
-    all_resolutions = ["1m", "5m", "15m", "30m", "1H", "4H", "1D", "1W", "1M"]
-    return all_resolutions.index(resolution1) < all_resolutions.index(resolution2)
+    return _RESOLUTION_RANK[resolution1] < _RESOLUTION_RANK[resolution2]
